@@ -0,0 +1,155 @@
+# ============================================================================
+# RESPONSE CACHE (cache.py)
+# ============================================================================
+#
+# WHAT IS THIS FILE?
+#   A small in-memory cache for finished API responses.
+#
+# WHY CACHE?
+#   GET /tasks and GET /tasks/{id} ask the database every time, even when
+#   nothing has changed. If we keep the finished JSON bytes for a short
+#   time, a repeated request skips the database AND the JSON encoding.
+#
+# OFF BY DEFAULT:
+#   RESPONSE_CACHE_TTL=0 (the default) turns it off. Turn it on only when
+#   ONE process serves the API (see LIMITATION).
+#
+# HOW IT STAYS CORRECT:
+#   1. Every entry expires after a few seconds (TTL = "time to live")
+#   2. Every write endpoint (POST/PUT/DELETE) clears the whole cache
+#   3. Every clear() adds 1 to `generation`. A GET notes the generation
+#      BEFORE its query and only stores its answer if nothing was
+#      cleared meanwhile - otherwise it could store data from before a
+#      write that finished while it was waiting for the database.
+#
+# LIMITATION:
+#   The cache lives inside ONE process. With several processes, a write
+#   in one of them doesn't clear the others, so they would serve old data
+#   until the TTL runs out. Only use it with a single process - or use a
+#   shared cache (e.g. Redis) instead.
+#
+# ============================================================================
+
+
+# ----------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------
+
+# time: monotonic() clock for expiry times (never jumps backwards)
+import time
+
+# Any/Hashable/Optional: Type hints
+from typing import Any, Hashable, Optional
+
+# Our settings (cache size and TTL)
+from app.config import settings
+
+
+# ----------------------------------------------------------------------------
+# TTL CACHE
+# ----------------------------------------------------------------------------
+
+class TTLCache:
+    """
+    Dictionary whose entries disappear after `ttl` seconds.
+
+    When it holds `maxsize` entries, adding one more removes the oldest.
+
+    Example:
+        cache = TTLCache(maxsize=100, ttl=30)
+        generation = cache.generation          # before the query
+        cache.set(("task", 1), (b'{"id": 1, ...}', '"3f2a..."'), generation)
+        cache.get(("task", 1))   # (body, etag) (for 30 seconds)
+        cache.clear()            # after a write (generation + 1)
+
+    Note:
+        Not thread-safe. Our async endpoints use it from the event loop
+        only (one thing at a time), which is all it needs.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        # key → (expires_at, value)
+        # dicts remember insertion order, so the first key is the oldest
+        self._data: dict = {}
+
+        # How many times clear() has run (see HOW IT STAYS CORRECT)
+        self.generation = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            # Too old - forget it
+            del self._data[key]
+            return None
+
+        return value
+
+    def set(
+        self, key: Hashable, value: Any, generation: Optional[int] = None
+    ) -> None:
+        """
+        Store a value for `ttl` seconds (does nothing if ttl is 0).
+
+        Pass the `generation` read before computing the value: if the
+        cache was cleared since then, the value may be outdated and is
+        not stored.
+        """
+        if self.ttl <= 0:
+            return
+        if generation is not None and generation != self.generation:
+            return
+
+        # Full? Drop the oldest entry to make room
+        if key not in self._data and len(self._data) >= self.maxsize:
+            del self._data[next(iter(self._data))]
+
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        """Forget everything (called after every write)."""
+        self._data.clear()
+        self.generation += 1
+
+
+# ----------------------------------------------------------------------------
+# THE APP'S RESPONSE CACHE
+# ----------------------------------------------------------------------------
+#
+# One shared instance, used by routers/tasks.py
+#
+
+response_cache = TTLCache(
+    maxsize=settings.response_cache_maxsize,
+    ttl=settings.response_cache_ttl,
+)
+
+
+# ----------------------------------------------------------------------------
+# WHAT YOU LEARNED IN THIS FILE
+# ----------------------------------------------------------------------------
+#
+# 1. CACHING:
+#    - Keep a finished result so the next identical request is instant
+#    - Trade-off: data can be up to `ttl` seconds old
+#
+# 2. INVALIDATION:
+#    - Clear the cache whenever data changes (our write endpoints)
+#    - A generation counter stops a slow read from re-adding stale data
+#
+# 3. TTL + MAXSIZE:
+#    - TTL limits how old an answer can be
+#    - maxsize limits how much memory the cache uses
+#
+# 4. PER-PROCESS:
+#    - An in-memory cache is only correct with a single process
+#    - So it's off unless RESPONSE_CACHE_TTL is set
+#
+# ============================================================================
@@ -33,9 +33,26 @@
 # SettingsConfigDict: Configuration for how to read the .env file
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Field: Extra rules for a setting (e.g. allowed range of a number)
+from pydantic import Field
+
 # Optional: Used when a value might or might not exist
 # Example: test_database_url might not be set
-from typing import Optional
+# get_origin: dict[str, str] → dict (tells us which settings hold JSON)
+from typing import Optional, get_origin
+
+# lru_cache: Remembers a function's result so it only runs once
+# Example: get_settings() builds Settings the first time, then reuses it
+from functools import lru_cache
+
+# os: Access to real environment variables (os.environ)
+import os
+
+# json: Decode dict/list settings written as JSON in .env
+import json
+
+# dotenv_values: Reads a .env file into a dictionary (without changing os.environ)
+from dotenv import dotenv_values
 
 
 # ----------------------------------------------------------------------------
@@ -141,6 +158,135 @@ class Settings(BaseSettings):
     #
     test_database_url: Optional[str] = None
 
+    # auto_create_tables: Create missing tables when the app starts?
+    # Type: Optional[bool]
+    # Default: None = "yes, unless environment is production"
+    #
+    # WHY NOT ALWAYS?
+    #   create_all() asks the database about every table on EVERY startup.
+    #   In production the schema should be managed by migrations (Alembic),
+    #   so those catalog queries are wasted cold-start time.
+    #
+    auto_create_tables: Optional[bool] = None
+
+    # worker_id: Number of THIS process in task ids (see app/models/task.py)
+    # Type: int, 0-31
+    # Default: 0 (fine for a single process)
+    #
+    # WHY?
+    #   Task ids are made in Python: time + worker_id + counter.
+    #   Two processes with the SAME worker_id can hand out the same id in
+    #   the same millisecond. Every process that writes tasks (each server,
+    #   each uvicorn worker) needs its own value:
+    #   WORKER_ID=0, WORKER_ID=1, ...
+    #
+    worker_id: int = Field(default=0, ge=0, le=31)
+
+
+    # =========================================================================
+    # CONNECTION POOL SETTINGS (PostgreSQL only)
+    # =========================================================================
+    # A "pool" keeps database connections open and reuses them, instead of
+    # opening a brand new connection (TCP + TLS + login) for every request.
+    #
+    # db_pool_size:     Connections kept open all the time
+    # db_max_overflow:  Extra connections allowed during traffic spikes
+    # db_pool_timeout:  Seconds to wait for a free connection before failing
+    # db_pool_recycle:  Replace connections older than this (seconds)
+    #                   (servers like Neon close idle connections)
+    # db_pool_pre_ping: Check a connection still works before using it
+    # db_pool_use_lifo: Hand out the MOST RECENTLY used connection first
+    #                   ("last in, first out"). That connection's caches
+    #                   (prepared statements, plans) are still warm, and
+    #                   rarely used extras go idle and get recycled.
+    # db_pool_reset_on_return: What to do with a connection given back to
+    #                   the pool ("rollback" = undo anything uncommitted)
+    #
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_pool_use_lifo: bool = True
+    db_pool_reset_on_return: str = "rollback"
+
+    # threadpool_size: How many blocking database calls can run at once
+    # Type: Optional[int]
+    # Default: None = as many as the engine's connection pool holds
+    #          (pool size + overflow, worked out at startup in main.py)
+    #
+    # WHY?
+    #   Our CRUD functions and get_session talk to the database
+    #   synchronously. FastAPI runs them in worker threads
+    #   (run_in_threadpool); only 40 threads exist by default. Matching
+    #   the thread count to the connection pool lets every pooled
+    #   connection be used - and no thread sits waiting for a connection
+    #   that isn't there (pool_timeout). A pool without a fixed size
+    #   (e.g. NullPool) keeps anyio's default of 40.
+    #
+    threadpool_size: Optional[int] = None
+
+    # db_query_cache_size: How many compiled SQL statements to remember
+    # Type: int
+    # Default: 1200 (SQLAlchemy's own default is 500)
+    #
+    # WHY?
+    #   Turning a Python query (select(Task)...) into SQL text takes time.
+    #   SQLAlchemy remembers compiled statements, so the same query shape
+    #   only gets compiled once. A bigger cache = fewer re-compiles.
+    #
+    db_query_cache_size: int = 1200
+
+    # db_prepare_threshold: Run a query this many times before PostgreSQL
+    # prepares it (psycopg 3 driver only). None = never prepare.
+    db_prepare_threshold: Optional[int] = 5
+
+    # db_plan_cache_mode: PostgreSQL plan_cache_mode for our connections
+    # Options: "auto" (server default), "force_custom_plan", "force_generic_plan"
+    # None = don't change the server's setting
+    db_plan_cache_mode: Optional[str] = None
+
+    # sqlite_pragmas: Performance settings applied to every SQLite connection
+    # Type: dict[str, str] (PRAGMA name → value)
+    # Only used when database_url is SQLite.
+    #
+    # WHAT DO THESE DO?
+    #   journal_mode=WAL    → Readers don't block the writer (and vice versa)
+    #   synchronous=NORMAL  → Fewer disk syncs per commit (still safe with WAL)
+    #   cache_size=-64000   → Keep ~64 MB of pages in memory (negative = KB)
+    #   temp_store=MEMORY   → Temporary tables/indexes live in RAM
+    #   mmap_size=268435456 → Read up to 256 MB of the file through memory
+    #                         mapping (no copy into SQLite's own buffers)
+    #
+    # To change in .env (JSON format):
+    #   SQLITE_PRAGMAS={"journal_mode": "WAL", "synchronous": "FULL"}
+    #
+    sqlite_pragmas: dict[str, str] = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": "-64000",
+        "temp_store": "MEMORY",
+        "mmap_size": "268435456",
+    }
+
+
+    # =========================================================================
+    # RESPONSE CACHE SETTINGS
+    # =========================================================================
+    # GET /tasks and GET /tasks/{id} can keep their finished JSON in memory
+    # (see app/cache.py). Any write clears it.
+    #
+    # response_cache_ttl:     Seconds an entry stays valid (0 = no caching)
+    # response_cache_maxsize: Maximum number of cached responses
+    #
+    # OFF BY DEFAULT:
+    #   The cache lives in ONE process, and a write only clears the cache
+    #   of the process that handled it. Only set RESPONSE_CACHE_TTL (e.g. 30)
+    #   when a single process serves the API.
+    #
+    response_cache_ttl: float = 0
+    response_cache_maxsize: int = 10_000
+
 
     # =========================================================================
     # PYDANTIC SETTINGS CONFIGURATION
@@ -151,12 +297,10 @@ class Settings(BaseSettings):
     #
     model_config = SettingsConfigDict(
         # env_file: Which file contains environment variables?
-        # ".env" = Look for file named .env in project root
-        env_file=".env",
-
-        # env_file_encoding: How is the file encoded?
-        # "utf-8" = Standard encoding (supports all characters)
-        env_file_encoding="utf-8",
+        # None = pydantic-settings does NOT open .env itself.
+        # We read .env ONCE below (see ENV_FILE / build_settings) and pass
+        # the values in, so building Settings() never touches the disk.
+        env_file=None,
 
         # case_sensitive: Does capitalization matter?
         # False = DATABASE_URL and database_url are the same
@@ -164,29 +308,140 @@ class Settings(BaseSettings):
 
         # extra: What to do with unknown variables in .env?
         # "ignore" = Don't crash if there are extra variables
-        extra="ignore"
+        extra="ignore",
+
+        # frozen: Can settings be changed after they're loaded?
+        # True = Read-only (settings.debug = True raises an error)
+        # Settings are loaded once at startup and never change while running
+        frozen=True
     )
 
 
+# ----------------------------------------------------------------------------
+# READ THE .env FILE (ONCE)
+# ----------------------------------------------------------------------------
+# The .env file is parsed a single time, when this module is imported.
+# Every Settings object is then built from this dictionary - no matter
+# how many times Settings is created (e.g. once per test with overrides).
+#
+# PRIORITY (highest wins):
+#   1. Values passed to build_settings(...)
+#   2. Real environment variables (export DEBUG=true)
+#   3. Values from the .env file
+#   4. Defaults in the Settings class
+#
+
+# ".env" = Look for file named .env in project root
+ENV_FILE = ".env"
+
+# {"DATABASE_URL": "...", "DEBUG": "True", ...} (empty if no .env file)
+_DOTENV_VALUES = dotenv_values(ENV_FILE, encoding="utf-8")
+
+# Settings that are dicts/lists (e.g. sqlite_pragmas). In .env they are
+# written as JSON text, and only the environment source decodes JSON by
+# itself - values passed to Settings(...) must already be a dict/list.
+_JSON_FIELDS = {
+    name
+    for name, field in Settings.model_fields.items()
+    if get_origin(field.annotation) in (dict, list, set, tuple)
+}
+
+
+def build_settings(**overrides) -> Settings:
+    """
+    Build a new Settings object from the already-parsed .env values.
+
+    Args:
+        **overrides: Settings to force (e.g. debug=True)
+
+    Returns:
+        Settings: A freshly validated Settings object
+
+    Example:
+        # In a test: same settings, but pretend we're in production
+        prod_settings = build_settings(environment="production")
+    """
+    # Real environment variables beat .env, so skip .env values that
+    # are also set in the environment (Settings reads those itself)
+    environ = {key.lower() for key in os.environ}
+    values = {
+        key.lower(): value
+        for key, value in _DOTENV_VALUES.items()
+        if value is not None and key.lower() not in environ
+    }
+
+    # SQLITE_PRAGMAS={"synchronous": "FULL"} → {"synchronous": "FULL"}
+    for name in _JSON_FIELDS & values.keys():
+        try:
+            values[name] = json.loads(values[name])
+        except json.JSONDecodeError as exc:
+            raise ValueError(
+                f"{name.upper()} in {ENV_FILE} must be valid JSON: {exc}"
+            ) from exc
+
+    values.update(overrides)
+    return Settings(**values)
+
+
 # ----------------------------------------------------------------------------
 # CREATE SETTINGS INSTANCE
 # ----------------------------------------------------------------------------
 # We create ONE settings object that the whole app shares.
 # This is called "Singleton Pattern" - only one instance exists.
 #
-# When this line runs:
-#   1. Python finds .env file
-#   2. Reads all variables from it
+# When Settings() is built:
+#   1. Takes the .env values (already read above)
+#   2. Reads the environment variables
 #   3. Matches them to our Settings fields
 #   4. Validates the types
 #   5. Creates the settings object
 #
+# WHY lru_cache?
+#   Building Settings() re-reads every environment variable and
+#   re-validates EACH time. @lru_cache(maxsize=1) makes get_settings() do
+#   that work only once per process - later calls return the same object.
+#
 # HOW TO USE IN OTHER FILES:
 #   from app.config import settings
 #   print(settings.database_url)
-#   print(settings.debug)
 #
-settings = Settings()
+#   Or as a FastAPI dependency (same cached instance):
+#   def my_route(settings: Settings = Depends(get_settings)): ...
+#
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the shared application settings.
+
+    The first call reads .env and environment variables.
+    Every later call returns the SAME cached Settings object.
+
+    Returns:
+        Settings: The validated application settings
+
+    Example:
+        settings = get_settings()
+        print(settings.app_name)
+    """
+    return build_settings()
+
+
+# Module-level shortcut (kept so "from app.config import settings" still works)
+settings = get_settings()
+
+# Frequently used settings as plain module constants.
+# Hot code (per-request paths) can import these directly instead of
+# going through the Pydantic model every time:
+#   from app.config import APP_NAME
+DATABASE_URL: str = settings.database_url
+DEBUG: bool = settings.debug
+APP_NAME: str = settings.app_name
+APP_VERSION: str = settings.app_version
+
+# The test database URL, resolved once.
+# If TEST_DATABASE_URL isn't set, tests use an in-memory SQLite database.
+EFFECTIVE_TEST_DB_URL: str = settings.test_database_url or "sqlite:///:memory:"
 
 
 # ----------------------------------------------------------------------------
@@ -196,6 +451,12 @@ settings = Settings()
 # Instead of writing: settings.environment == "production"
 # You can write: is_production()
 #
+# The environment name is lowercased ONCE here (settings never change
+# while the app runs), so the helpers below are a simple comparison.
+#
+
+_ENV = settings.environment.lower()
+
 
 def is_production() -> bool:
     """
@@ -209,7 +470,7 @@ def is_production() -> bool:
             # Use strict security settings
             pass
     """
-    return settings.environment.lower() == "production"
+    return _ENV == "production"
 
 
 def is_development() -> bool:
@@ -224,7 +485,7 @@ def is_development() -> bool:
             # Enable debug features
             pass
     """
-    return settings.environment.lower() == "development"
+    return _ENV == "development"
 
 
 def is_testing() -> bool:
@@ -239,7 +500,16 @@ def is_testing() -> bool:
             # Use test database
             pass
     """
-    return settings.environment.lower() == "testing"
+    return _ENV == "testing"
+
+
+# Should lifespan() create tables on startup? (resolved once)
+# Explicit AUTO_CREATE_TABLES wins; otherwise only outside production.
+AUTO_CREATE_TABLES: bool = (
+    settings.auto_create_tables
+    if settings.auto_create_tables is not None
+    else not is_production()
+)
 
 
 # ----------------------------------------------------------------------------
@@ -267,4 +537,11 @@ def is_testing() -> bool:
 #    - Type validation
 #    - .env file support
 #
+# 5. CACHING:
+#    - @lru_cache(maxsize=1) runs get_settings() only once
+#    - .env is parsed a single time per process (dotenv_values)
+#    - build_settings() reuses the parsed values for new Settings
+#    - frozen=True makes settings read-only after loading
+#    - Constants (APP_NAME, DEBUG, ...) for hot code paths
+#
 # ============================================================================
@@ -17,20 +17,58 @@
 #
 # ============================================================================
 
-# Import all task CRUD functions for easy access
-from app.crud.task import (
-    create_task,
-    get_task,
-    get_tasks,
-    update_task,
-    delete_task
-)
+# importlib: Imports a module by its name (a string) at runtime
+import importlib
+
+# ----------------------------------------------------------------------------
+# LAZY IMPORTS
+# ----------------------------------------------------------------------------
+# Importing app.crud.task pulls in SQLModel, the models and the schemas.
+# Instead of paying that cost as soon as "app.crud" is imported, we only
+# import the real module the FIRST time one of its functions is used.
+#
+# HOW IT WORKS (PEP 562):
+#   from app.crud import create_task
+#   → Python doesn't find "create_task" in this file
+#   → calls __getattr__("create_task") below
+#   → we import app.crud.task and return its create_task
+#
+
+# Which module each exported name lives in
+_LAZY = {
+    "create_task": "app.crud.task",
+    "create_tasks_bulk": "app.crud.task",
+    "bulk_insert_tasks": "app.crud.task",
+    "upsert_task": "app.crud.task",
+    "get_task": "app.crud.task",
+    "get_tasks": "app.crud.task",
+    "get_tasks_iter": "app.crud.task",
+    "get_tasks_after": "app.crud.task",
+    "get_task_row": "app.crud.task",
+    "get_task_rows": "app.crud.task",
+    "get_task_page": "app.crud.task",
+    "iter_task_rows": "app.crud.task",
+    "update_task": "app.crud.task",
+    "delete_task": "app.crud.task",
+}
+
+
+def __getattr__(name: str):
+    """Import a CRUD function on first access."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+
+    # Save it on this module so the next access skips __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include the lazy names in dir(app.crud) (helps autocomplete)."""
+    return sorted(list(globals()) + list(_LAZY))
+
 
 # Export list
-__all__ = [
-    "create_task",
-    "get_task",
-    "get_tasks",
-    "update_task",
-    "delete_task"
-]
+__all__ = list(_LAZY)
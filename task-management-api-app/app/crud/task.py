@@ -30,14 +30,27 @@
 # ----------------------------------------------------------------------------
 
 # Session: For database conversations
-from sqlmodel import Session, select
+# select/insert/update/delete: Build SELECT, INSERT, UPDATE and DELETE statements
+from sqlmodel import Session, select, insert, update, delete
 
-# Optional, List: Type hints
-from typing import Optional, List
+# lambda_stmt: Builds a query whose compiled SQL is cached and reused
+# func: SQL functions (func.now() = the database's current time)
+# RowMapping: One result row that behaves like a read-only dict
+# bindparam: A named placeholder whose value is supplied at execute time
+from sqlalchemy import lambda_stmt, func, RowMapping, bindparam
 
-# datetime: For updating timestamps
-# timezone: For timezone-aware timestamps (UTC)
-from datetime import datetime, timezone
+# Connection: Plain database connection (no Session, for Core reads)
+from sqlalchemy.engine import Connection
+
+# Database-specific INSERTs that support "ON CONFLICT DO UPDATE" (upsert)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+# Optional, List, Iterator, Tuple: Type hints
+from typing import Optional, List, Iterator, Tuple
+
+# lru_cache: Remember a function's result for each argument (see UPDATE)
+from functools import lru_cache
 
 # Our Task model (database table structure)
 from app.models.task import Task
@@ -58,7 +71,7 @@ from app.schemas.task import TaskCreate, TaskUpdate
 #   2. Create Task model instance
 #   3. Add to database session
 #   4. Commit (save) to database
-#   5. Refresh (get auto-generated fields like id)
+#   5. Refresh (get database-generated fields like created_at)
 #   6. Return the created task
 #
 
@@ -79,15 +92,16 @@ def create_task(session: Session, task_data: TaskCreate) -> Task:
         print(new_task.id)  # Auto-generated ID
 
     What happens:
-        1. task_data.model_dump() converts schema to dictionary
-        2. Task(**dict) creates model instance from dictionary
-        3. session.add() marks task for insertion
-        4. session.commit() saves to database
-        5. session.refresh() updates object with DB-generated values
+        1. Task.model_validate() copies the fields straight from the schema
+           (no temporary dictionary in between)
+        2. session.add() marks task for insertion
+        3. session.commit() saves to database
+        4. session.refresh() updates object with DB-generated values
     """
-    # Convert schema to dictionary, then create Task model
-    # model_dump() is Pydantic's way to convert to dict
-    task = Task(**task_data.model_dump())
+    # Create Task model directly from the schema's attributes
+    # from_attributes=True reads task_data.title, task_data.status, ...
+    # This skips building a dict with model_dump() and unpacking it again
+    task = Task.model_validate(task_data, from_attributes=True)
 
     # Add task to session (mark for insertion)
     # This doesn't save yet - just tells session "I want to add this"
@@ -98,13 +112,196 @@ def create_task(session: Session, task_data: TaskCreate) -> Task:
     session.commit()
 
     # Refresh the task object with database-generated values
-    # This gets the auto-generated id, created_at, etc.
+    # This gets the database-generated created_at and updated_at
     session.refresh(task)
 
     # Return the complete task with all fields
     return task
 
 
+# Used by create_tasks_bulk() (below) to re-read the tasks it just inserted.
+# expanding=True: ONE placeholder that becomes "IN (?, ?, ...)" with as
+# many values as each call passes. Built once, like the Core reads below.
+# populate_existing: write the loaded values into the Task objects we
+# already hold (instead of keeping their old, empty timestamps)
+_RESELECT_CHUNK_SIZE = 500
+_SELECT_TASKS_BY_IDS = (
+    select(Task)
+    .where(Task.id.in_(bindparam("ids", expanding=True)))
+    .order_by(Task.id)
+    .execution_options(populate_existing=True)
+)
+
+
+def create_tasks_bulk(session: Session, items: List[TaskCreate]) -> List[Task]:
+    """
+    Create many tasks in ONE database transaction.
+
+    Args:
+        session: Database session (connection)
+        items: List of TaskCreate schemas
+
+    Returns:
+        List[Task]: The newly created tasks (same order as items)
+
+    Example:
+        new_tasks = create_tasks_bulk(session, [
+            TaskCreate(title="Task 1"),
+            TaskCreate(title="Task 2"),
+        ])
+
+    Why not call create_task() in a loop?
+        Each create_task() call commits on its own.
+        100 tasks = 100 commits (100 disk syncs on SQLite).
+        Here: add_all() + ONE commit for the whole batch,
+        then one SELECT per 500 tasks to load their timestamps.
+    """
+    # Build all Task objects first
+    tasks = [Task.model_validate(item, from_attributes=True) for item in items]
+
+    # Mark all of them for insertion at once
+    session.add_all(tasks)
+
+    # One commit for the whole batch
+    session.commit()
+
+    # Load the database-generated timestamps - one query per 500 tasks
+    # (instead of session.refresh() per task = one query EACH).
+    # The ids were picked in Python, so we already know which rows to read.
+    # Each id is one "?" in the SQL, and older SQLite builds allow only
+    # 999 of them per statement - hence the chunks.
+    ids = [task.id for task in tasks]
+    for start in range(0, len(ids), _RESELECT_CHUNK_SIZE):
+        session.scalars(
+            _SELECT_TASKS_BY_IDS,
+            {"ids": ids[start:start + _RESELECT_CHUNK_SIZE]},
+        ).all()
+
+    return tasks
+
+
+def bulk_insert_tasks(
+    session: Session,
+    rows: List[dict],
+    batch_size: int = 50
+) -> int:
+    """
+    Insert many tasks from plain dictionaries, as fast as possible.
+
+    Unlike create_tasks_bulk(), this skips the ORM completely:
+    no Task objects are created and nothing is refreshed afterwards.
+    Use it for imports/seeding where you don't need the new tasks back.
+
+    Args:
+        session: Database session
+        rows: Task data as dictionaries, e.g. [{"title": "A"}, ...]
+              (validate them first, e.g. TaskCreate(**row).model_dump())
+        batch_size: Rows sent per INSERT statement (40-50 works well)
+
+    Returns:
+        int: Number of rows inserted
+
+    Example:
+        rows = [TaskCreate(title=t).model_dump() for t in titles]
+        bulk_insert_tasks(session, rows)
+
+    What happens:
+        1. Split rows into batches of batch_size
+        2. Each batch = ONE "INSERT ... VALUES (...), (...), ..." statement
+        3. ONE commit at the end
+        Column defaults (id, status, priority, timestamps) still apply.
+    """
+    statement = insert(Task)
+
+    for start in range(0, len(rows), batch_size):
+        session.execute(statement, rows[start:start + batch_size])
+
+    session.commit()
+
+    return len(rows)
+
+
+# ----------------------------------------------------------------------------
+# UPSERT OPERATION ("insert or update")
+# ----------------------------------------------------------------------------
+#
+# WHAT IT DOES:
+#   Saves a task with a given id: creates it if the id is new,
+#   otherwise overwrites the existing row.
+#
+# WHY NOT get() THEN add()?
+#   That's two round-trips, and two requests can both see "doesn't
+#   exist" and both try to INSERT. "INSERT ... ON CONFLICT DO UPDATE"
+#   does the check and the write in ONE atomic statement.
+#
+
+# Which INSERT construct supports ON CONFLICT on each database
+_UPSERT_INSERTS = {
+    "postgresql": pg_insert,
+    "sqlite": sqlite_insert,
+}
+
+
+def upsert_task(session: Session, values: dict) -> Task:
+    """
+    Insert a task, or update it if a task with the same id exists.
+
+    Args:
+        session: Database session
+        values: Column values, including "id"
+                e.g. {"id": 42, "title": "Buy milk", "status": "pending"}
+
+    Returns:
+        Task: The task as it is now stored
+
+    Example:
+        task = upsert_task(session, {"id": 42, "title": "Imported"})
+
+    What happens:
+        PostgreSQL / SQLite:
+            INSERT INTO task (...) VALUES (...)
+            ON CONFLICT (id) DO UPDATE SET title = excluded.title, ...
+            RETURNING *
+        ("excluded" = the row we tried to insert)
+
+        Other databases fall back to session.merge()
+        (SELECT first, then INSERT or UPDATE).
+    """
+    make_insert = _UPSERT_INSERTS.get(session.get_bind().dialect.name)
+
+    if make_insert is None:
+        task = session.merge(Task(**values))
+        session.commit()
+        session.refresh(task)
+        return task
+
+    statement = make_insert(Task).values(**values)
+
+    # Columns to overwrite when the id already exists (never the id itself)
+    # updated_at is bumped whenever the row is overwritten (database clock,
+    # like update_task())
+    set_ = {
+        column: statement.excluded[column]
+        for column in values
+        if column != "id"
+    }
+    set_["updated_at"] = func.now()
+
+    statement = statement.on_conflict_do_update(
+        index_elements=[Task.id],
+        set_=set_,
+    ).returning(Task)
+
+    # populate_existing: if this task is already loaded in the session,
+    # overwrite it with the row the database sent back
+    task = session.scalars(
+        statement, execution_options={"populate_existing": True}
+    ).one()
+    session.commit()
+
+    return task
+
+
 # ----------------------------------------------------------------------------
 # READ OPERATIONS
 # ----------------------------------------------------------------------------
@@ -112,6 +309,12 @@ def create_task(session: Session, task_data: TaskCreate) -> Task:
 # Two types of read:
 #   1. Get ONE task by ID
 #   2. Get ALL tasks (with optional filters)
+#      - get_tasks(): returns a list (all rows in memory)
+#      - get_tasks_iter(): streams rows in chunks (low memory)
+#      - get_tasks_after(): keyset pagination (fast for deep pages)
+#   3. "Core" reads on a plain Connection (get_task_row, get_task_rows,
+#      get_task_page, iter_task_rows)
+#      - No Session, no Task objects: rows come back as dicts
 #
 
 def get_task(session: Session, task_id: int) -> Optional[Task]:
@@ -157,7 +360,7 @@ def get_tasks(
         limit: Maximum number of tasks to return
 
     Returns:
-        List[Task]: List of task objects
+        List[Task]: List of task objects, ordered by id
 
     Example:
         # Get first 10 tasks
@@ -167,10 +370,10 @@ def get_tasks(
         tasks = get_tasks(session, skip=10, limit=10)
 
     What happens:
-        1. select(Task) creates a SELECT query
+        1. select(Task) creates a SELECT query (compiled once, then cached)
         2. offset(skip) skips first N results
         3. limit(limit) caps maximum results
-        4. session.exec() runs the query
+        4. session.scalars() runs the query
         5. .all() converts to list
 
     Pagination explained:
@@ -178,14 +381,258 @@ def get_tasks(
         skip=10, limit=10 → Tasks 11-20
         skip=20, limit=10 → Tasks 21-30
     """
-    # Build the query
+    # Build the query with lambda_stmt
     # select(Task) = "SELECT * FROM task"
-    statement = select(Task).offset(skip).limit(limit)
+    # order_by(Task.id) = oldest first, so every page is the same slice
+    #
+    # WHY lambda_stmt?
+    #   A normal select(...) is rebuilt and re-compiled to SQL on EVERY call.
+    #   lambda_stmt caches the compiled SQL by the lambdas' code location,
+    #   so later calls only swap in the new skip/limit values.
+    statement = lambda_stmt(lambda: select(Task).order_by(Task.id))
+    statement += lambda s: s.offset(skip)
+    statement += lambda s: s.limit(limit)
+
+    # Execute query and get all Task objects as a list
+    # scalars() gives Task objects directly (lambda statements would
+    # otherwise come back as one-item rows)
+    return session.scalars(statement).all()
+
+
+def get_tasks_iter(
+    session: Session,
+    skip: int = 0,
+    limit: int = 100
+) -> Iterator[Task]:
+    """
+    Get tasks one at a time instead of as a full list.
+
+    Same kind of query as get_tasks(), but rows are fetched from the
+    database in chunks of 128 (yield_per) and handed out as you loop.
+    Only one chunk is in memory at a time - useful for big exports.
+    Tasks come out ordered by id (oldest first).
+
+    Args:
+        session: Database session (must stay open while you iterate!)
+        skip: Number of tasks to skip
+        limit: Maximum number of tasks to return
+
+    Returns:
+        Iterator[Task]: Tasks, produced lazily while looping
+
+    Example:
+        for task in get_tasks_iter(session, limit=10_000):
+            write_csv_row(task)
+    """
+    # yield_per=128: fetch rows in batches of 128 instead of all at once
+    # order_by(Task.id): a stable order, so skip/limit mean the same rows
+    # on every call
+    statement = (
+        select(Task)
+        .order_by(Task.id)
+        .offset(skip)
+        .limit(limit)
+        .execution_options(yield_per=128)
+    )
+
+    # No .all() here - return the result itself so rows stream out
+    # scalars() hands out Task objects directly (no row tuples)
+    return session.scalars(statement)
+
+
+def get_tasks_after(
+    session: Session,
+    after_id: int = 0,
+    limit: int = 100
+) -> List[Task]:
+    """
+    Get the next page of tasks after a given id ("keyset" pagination).
 
-    # Execute query and get all results as a list
-    results = session.exec(statement)
+    Args:
+        session: Database session
+        after_id: The id of the LAST task you already have (0 = start)
+        limit: Maximum number of tasks to return
+
+    Returns:
+        List[Task]: Tasks with id > after_id, ordered by id
+
+    Example:
+        page1 = get_tasks_after(session, after_id=0, limit=10)
+        page2 = get_tasks_after(session, after_id=page1[-1].id, limit=10)
+
+    Why not skip/offset?
+        OFFSET 10000 makes the database read and throw away 10,000 rows.
+        WHERE id > 10000 jumps straight there using the primary key index.
+        Every page costs the same, no matter how deep you go.
+        The "cursor" is simply the id of the last task returned.
+    """
+    statement = (
+        select(Task)
+        .where(Task.id > after_id)
+        .order_by(Task.id)
+        .limit(limit)
+    )
+
+    # scalars() returns Task objects directly (no row tuples)
+    return session.scalars(statement).all()
+
+
+# Pre-built statements for the Core reads below
+# Built ONCE when this module is imported; each call only supplies the
+# values for the :task_id / :skip / :limit placeholders.
+_SELECT_TASK_BY_ID = select(Task).where(Task.id == bindparam("task_id"))
+
+# List pages only select the columns of TaskListItem
+# (no description or timestamps - much smaller rows)
+_TASK_LIST_COLUMNS = (
+    Task.id, Task.title, Task.status, Task.priority, Task.due_date
+)
+# ORDER BY id: without it the database may return rows in any order, so
+# skip/limit pages could overlap or miss tasks (ids grow over time, so
+# this is oldest first - and the primary key index serves it)
+_SELECT_TASK_PAGE = (
+    select(*_TASK_LIST_COLUMNS)
+    .order_by(Task.id)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+_SELECT_TASKS_AFTER = (
+    select(*_TASK_LIST_COLUMNS)
+    .where(Task.id > bindparam("after_id"))
+    .order_by(Task.id)
+    .limit(bindparam("limit"))
+)
+_COUNT_TASKS = select(func.count()).select_from(Task)
+_SELECT_ALL_TASKS = select(Task).order_by(Task.id)
+
+
+def get_task_row(connection: Connection, task_id: int) -> Optional[RowMapping]:
+    """
+    Get a single task as a plain row (no Session, no Task object).
+
+    Args:
+        connection: Plain database connection (see run_with_connection)
+        task_id: The unique identifier of the task
+
+    Returns:
+        RowMapping: The task's columns as a read-only dict, if found
+        None: If no task with that ID exists
+
+    Example:
+        row = get_task_row(connection, task_id=1)
+        if row:
+            print(row["title"])
+    """
+    # mappings() = rows as dicts ({"id": 1, "title": ...})
+    return connection.execute(
+        _SELECT_TASK_BY_ID, {"task_id": task_id}
+    ).mappings().first()
+
+
+def get_task_rows(
+    connection: Connection,
+    skip: int = 0,
+    limit: int = 100
+) -> List[RowMapping]:
+    """
+    Get a page of tasks as plain rows (no Session, no Task objects).
+
+    Same page as get_tasks(), for endpoints that only READ - but only
+    the columns of a list item (id, title, status, priority, due_date).
+
+    Args:
+        connection: Plain database connection (see run_with_connection)
+        skip: Number of tasks to skip (for pagination)
+        limit: Maximum number of tasks to return
+
+    Returns:
+        List[RowMapping]: One read-only dict per task (TaskListItem fields)
+
+    Why is this faster than get_tasks()?
+        The ORM builds a Task object per row and registers each one in
+        the Session (identity map, change tracking). A read-only endpoint
+        never uses any of that - plain rows skip the whole layer.
+    """
+    return connection.execute(
+        _SELECT_TASK_PAGE, {"skip": skip, "limit": limit}
+    ).mappings().all()
+
+
+def get_task_page(
+    connection: Connection,
+    skip: int = 0,
+    limit: int = 100,
+    after_id: Optional[int] = None
+) -> Tuple[List[RowMapping], int]:
+    """
+    Get one page of tasks AND the total number of tasks.
+
+    Args:
+        connection: Plain database connection (see run_with_connection)
+        skip: Number of tasks to skip (for pagination)
+        limit: Maximum number of tasks to return
+        after_id: If given, use keyset pagination instead of skip:
+                  tasks with id > after_id, ordered by id
+                  (see get_tasks_after() for why that's faster)
+
+    Returns:
+        Tuple[List[RowMapping], int]: (rows on this page, tasks in total)
+
+    Example:
+        rows, total = get_task_page(connection, skip=20, limit=10)
+        # rows = tasks 21-30, total = 57 → there are 6 pages
 
-    return results.all()
+        rows, total = get_task_page(connection, after_id=0, limit=10)
+        rows, total = get_task_page(connection, after_id=rows[-1]["id"], limit=10)
+
+    What happens:
+        1. SELECT id, title, status, priority, due_date ... LIMIT/OFFSET
+           (or WHERE id > :after_id ... LIMIT)
+           → only this page's rows, only the list columns
+        2. SELECT count(*) FROM task → the total (the database counts,
+           no rows are sent to Python)
+        Both run on the same connection, one after the other.
+    """
+    if after_id is None:
+        rows = get_task_rows(connection, skip=skip, limit=limit)
+    else:
+        rows = connection.execute(
+            _SELECT_TASKS_AFTER, {"after_id": after_id, "limit": limit}
+        ).mappings().all()
+
+    total = connection.execute(_COUNT_TASKS).scalar_one()
+    return rows, total
+
+
+def iter_task_rows(
+    connection: Connection,
+    batch_size: int = 200
+) -> Iterator[RowMapping]:
+    """
+    Get EVERY task as plain rows, one at a time (ordered by id).
+
+    The Core version of get_tasks_iter(): rows are fetched in batches of
+    batch_size and handed out as you loop, so memory stays flat no
+    matter how many tasks there are.
+
+    Args:
+        connection: Plain database connection
+                    (must stay open while you iterate!)
+        batch_size: How many rows to fetch from the database at once
+
+    Returns:
+        Iterator[RowMapping]: One read-only dict per task (TaskRead fields)
+
+    Example:
+        with borrow_connection(engine) as connection:
+            for row in iter_task_rows(connection):
+                write_csv_row(row)
+    """
+    # yield_per: fetch batch_size rows at a time instead of all at once
+    # (PostgreSQL uses a server-side cursor for this)
+    return connection.execute(
+        _SELECT_ALL_TASKS, execution_options={"yield_per": batch_size}
+    ).mappings()
 
 
 # ----------------------------------------------------------------------------
@@ -195,12 +642,57 @@ def get_tasks(
 # WHAT IT DOES:
 #   Modifies an existing task with new data.
 #
+# STATEMENT CACHE:
+#   A request only changes SOME fields, so the UPDATE statement depends
+#   on which ones. There are only 5 updatable fields → at most 32
+#   different statements. _update_statement() builds each one ONCE and
+#   lru_cache hands back the same object afterwards; the values go in
+#   as bind parameters. The identical statement object also lets
+#   SQLAlchemy reuse its compiled SQL without re-analysing it.
+#
 # IMPORTANT:
 #   - Only updates fields that are provided (not None)
-#   - Automatically updates the updated_at timestamp
+#   - Automatically updates the updated_at timestamp (unless nothing
+#     was sent - then nothing is written at all)
 #   - Returns None if task doesn't exist
 #
 
+@lru_cache(maxsize=32)
+def _update_statement(fields: Tuple[str, ...]):
+    """
+    Build "UPDATE task SET <fields>, updated_at=now() WHERE id = :task_id
+    RETURNING *" for one combination of fields (cached).
+
+    Args:
+        fields: Names of the fields to change, sorted
+                (so ("status", "title") and ("title", "status") are
+                the same cache entry)
+
+    Example:
+        _update_statement(("status", "title"))
+        # values: {"task_id": 1, "new_status": ..., "new_title": ...}
+    """
+    columns = Task.__table__.c
+
+    # One placeholder per field. "new_" prefix: SQLAlchemy reserves the
+    # plain column names for its own SET parameters.
+    # type_= keeps the column's conversions (e.g. enum member → name)
+    values = {
+        field: bindparam(f"new_{field}", type_=columns[field].type)
+        for field in fields
+    }
+
+    # func.now() is evaluated BY THE DATABASE (same clock as created_at)
+    values["updated_at"] = func.now()
+
+    return (
+        update(Task)
+        .where(Task.id == bindparam("task_id"))
+        .values(values)
+        .returning(Task)
+    )
+
+
 def update_task(
     session: Session,
     task_id: int,
@@ -228,37 +720,75 @@ def update_task(
         updated_task = update_task(session, task_id=1, task_data=update_data)
 
     What happens:
-        1. Find the task by ID
-        2. If not found, return None
-        3. Loop through provided fields
-        4. Update only non-None fields
-        5. Update the updated_at timestamp
-        6. Commit and refresh
+        1. Collect only the fields the user actually sent
+           (none at all? nothing to write - just return the task)
+        2. Run ONE "UPDATE ... RETURNING" statement
+           (changes the row AND sends it back in a single trip;
+           the statement for this set of fields is built only once)
+        3. If no row came back, the task doesn't exist → return None
+        4. Commit
+
+        Databases without RETURNING support fall back to the classic
+        get → setattr → commit → refresh path.
     """
-    # First, get the existing task
+    # Get update data as dictionary, only for fields the user actually sent
+    # model_fields_set = names of fields that were provided in the request
+    # This allows partial updates (only change what user sends)
+    # (Reading them directly is cheaper than model_dump(exclude_unset=True))
+    update_dict = {
+        field: getattr(task_data, field)
+        for field in task_data.model_fields_set
+    }
+
+    # Nothing to change (e.g. PUT with {})? Skip the write completely:
+    # no UPDATE, no commit, updated_at stays as it is.
+    # session.get() returns None if the task doesn't exist (→ 404)
+    if not update_dict:
+        return session.get(Task, task_id)
+
+    # Fast path: UPDATE ... RETURNING (SQLite 3.35+, PostgreSQL)
+    # One round-trip instead of SELECT + UPDATE + SELECT
+    if session.get_bind().dialect.update_returning:
+        # Cached statement for exactly these fields (updated_at included)
+        statement = _update_statement(tuple(sorted(update_dict)))
+        params = {f"new_{field}": value for field, value in update_dict.items()}
+        params["task_id"] = task_id
+
+        # populate_existing: if this task is already loaded in the session,
+        # overwrite it with the row the database sent back
+        task = session.scalars(
+            statement, params, execution_options={"populate_existing": True}
+        ).one_or_none()
+
+        # If task doesn't exist, no row is returned
+        # Router will convert this to 404 Not Found
+        if task is None:
+            return None
+
+        # Commit changes to database
+        session.commit()
+        return task
+
+    # Fallback path: load the task, change it in Python, then save
     task = session.get(Task, task_id)
 
+    # Something changes (empty patches returned early above), so bump
+    # the updated_at timestamp too (database clock, see above)
+    update_dict["updated_at"] = func.now()
+
     # If task doesn't exist, return None
-    # Router will convert this to 404 Not Found
     if not task:
         return None
 
-    # Get update data as dictionary, excluding unset fields
-    # exclude_unset=True means: only include fields that were actually provided
-    # This allows partial updates (only change what user sends)
-    update_dict = task_data.model_dump(exclude_unset=True)
-
     # Update each provided field
     for field, value in update_dict.items():
         # setattr() sets an attribute on an object
         # setattr(task, "title", "New Title") is same as task.title = "New Title"
         setattr(task, field, value)
 
-    # Always update the updated_at timestamp
-    task.updated_at = datetime.now(timezone.utc)
-
-    # Add to session (mark as modified)
-    session.add(task)
+    # No session.add() needed here:
+    # session.get() already put the task in the session, and setattr()
+    # marked it as changed ("dirty"), so commit() knows to UPDATE it.
 
     # Commit changes to database
     session.commit()
@@ -281,6 +811,11 @@ def update_task(
 #   In production, consider "soft delete" (mark as deleted, don't remove).
 #
 
+# Pre-built like the read statements: only :task_id changes per call
+_DELETE_TASK = delete(Task).where(Task.id == bindparam("task_id"))
+_DELETE_TASK_RETURNING_ID = _DELETE_TASK.returning(Task.id)
+
+
 def delete_task(session: Session, task_id: int) -> bool:
     """
     Delete a task from the database.
@@ -300,11 +835,12 @@ def delete_task(session: Session, task_id: int) -> bool:
             print("Task not found")
 
     What happens:
-        1. Find the task by ID
-        2. If not found, return False
-        3. Delete the task
-        4. Commit the deletion
-        5. Return True
+        1. Run ONE "DELETE FROM task WHERE id = ? RETURNING id" statement
+        2. Commit the deletion
+        3. A returned id = deleted, nothing returned = task didn't exist
+
+        No SELECT first - we never load the task just to throw it away.
+        (Databases without RETURNING use the deleted-row count instead.)
 
     Security note:
         In production, consider "soft delete":
@@ -312,20 +848,25 @@ def delete_task(session: Session, task_id: int) -> bool:
         - Set to True instead of actually deleting
         - Allows recovery of accidentally deleted data
     """
-    # Find the task
-    task = session.get(Task, task_id)
+    # Delete directly in the database (no need to load the task first)
+    params = {"task_id": task_id}
 
-    # If task doesn't exist, return False
-    if not task:
-        return False
+    # Fast path: DELETE ... RETURNING id (SQLite 3.35+, PostgreSQL)
+    # The database tells us exactly which row it deleted
+    if session.get_bind().dialect.delete_returning:
+        deleted_id = session.scalars(
+            _DELETE_TASK_RETURNING_ID, params
+        ).one_or_none()
+        session.commit()
+        return deleted_id is not None
 
-    # Delete the task
-    session.delete(task)
+    result = session.exec(_DELETE_TASK, params=params)
 
     # Commit the deletion
     session.commit()
 
-    return True
+    # rowcount = number of rows deleted (0 means task didn't exist)
+    return result.rowcount > 0
 
 
 # ----------------------------------------------------------------------------
@@ -334,9 +875,12 @@ def delete_task(session: Session, task_id: int) -> bool:
 #
 # 1. CRUD PATTERN:
 #    - Create: session.add() + commit() + refresh()
+#    - Bulk create: session.add_all() + ONE commit()
+#    - Bulk insert: insert(Task) with a list of dicts (no ORM objects)
 #    - Read: session.get() for one, select().exec().all() for many
-#    - Update: get, modify fields, add, commit, refresh
-#    - Delete: get, session.delete(), commit
+#    - Update: UPDATE ... RETURNING + commit (one round-trip)
+#      (@lru_cache: one statement per set of changed fields, built once)
+#    - Delete: DELETE ... WHERE id = ? RETURNING id + commit
 #
 # 2. SESSION OPERATIONS:
 #    - session.add(obj): Mark for insert/update
@@ -345,14 +889,17 @@ def delete_task(session: Session, task_id: int) -> bool:
 #    - session.delete(obj): Mark for deletion
 #    - session.get(Model, id): Get by primary key
 #    - session.exec(statement): Run a query
+#    - session.scalars(statement): Run a query, get objects (not rows)
 #
 # 3. QUERY BUILDING:
 #    - select(Model): Start a SELECT query
 #    - .offset(n): Skip first n rows
 #    - .limit(n): Return max n rows
+#    - .where(Task.id > x).order_by(Task.id): keyset pagination
+#    - execution_options(yield_per=n): fetch big results in batches
 #
 # 4. PARTIAL UPDATES:
-#    - model_dump(exclude_unset=True): Only provided fields
+#    - model_fields_set: Names of the fields that were provided
 #    - setattr(): Dynamically set attributes
 #
 # 5. RETURN VALUES:
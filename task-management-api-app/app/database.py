@@ -38,10 +38,31 @@ from sqlmodel import create_engine, Session, SQLModel
 from contextlib import contextmanager
 
 # Generator: Type hint for functions that yield values
-from typing import Generator
+# Callable/TypeVar: Type hints for run_with_connection (any function)
+from typing import Generator, Callable, TypeVar, Union, Iterator
+
+# logging: Python's built-in logging (instead of print)
+import logging
+
+# event: Lets us run code when SQLAlchemy does something (e.g. connects)
+# text: Wraps a raw SQL string so it can be executed
+from sqlalchemy import event, text
+
+# QueuePool: Connection pool that reuses a fixed number of connections
+# NullPool: "No pool" - open a connection per use, close it afterwards
+from sqlalchemy.pool import QueuePool, NullPool
+
+# make_url: Splits a database URL into parts (backend, driver, host, ...)
+from sqlalchemy.engine import make_url
+
+# Engine: Type hint for the engine (what read endpoints receive)
+from sqlalchemy.engine import Engine, Connection
 
 # Import our settings (database URL, debug mode, etc.)
-from app.config import settings
+from app.config import settings, DATABASE_URL, DEBUG
+
+# T = "whatever type the function returns" (see run_with_connection)
+T = TypeVar("T")
 
 
 # ----------------------------------------------------------------------------
@@ -71,34 +92,167 @@ from app.config import settings
 #   └── Database type
 #
 # IMPORTANT PARAMETERS:
-#   - echo: If True, prints all SQL commands (helpful for debugging)
+#   - echo: If True, prints all SQL commands (we use the logger instead)
 #   - connect_args: Extra connection settings
+#   - pool_*: How many connections to keep open and reuse (PostgreSQL)
+#   - query_cache_size: How many compiled SQL statements to remember
 #
 
+# Parse the URL once so we know which database and driver we're using
+# Example: "postgresql+psycopg://..." → backend "postgresql", driver "psycopg"
+db_url = make_url(DATABASE_URL)
+
 # Check if we're using SQLite (needed for special settings)
 # SQLite requires "check_same_thread": False for FastAPI
 # (FastAPI uses multiple threads, SQLite by default allows only one)
-is_sqlite = settings.database_url.startswith("sqlite")
+is_sqlite = db_url.get_backend_name() == "sqlite"
+is_postgres = db_url.get_backend_name() == "postgresql"
+
+# External connection pooler (PgBouncer, Neon's "-pooler" endpoint)
+#
+#   In "transaction" mode the pooler gives each TRANSACTION a possibly
+#   different server connection. Prepared statements live on one server
+#   connection, so they break, and our own pool would just be a second
+#   pool in front of the real one.
+#
+#   Detected from the URL:
+#     ...?pgbouncer=true         (explicit flag)
+#     ...?pool=transaction       (explicit flag)
+#     ...@ep-xyz-pooler.neon.tech (Neon's pooled host name)
+#
+#   The flags are removed from the URL (the driver doesn't know them).
+#
+uses_external_pooler = is_postgres and (
+    db_url.query.get("pgbouncer", "").lower() == "true"
+    or db_url.query.get("pool", "").lower() == "transaction"
+    or "-pooler." in (db_url.host or "")
+)
+db_url = db_url.difference_update_query(["pgbouncer", "pool"])
 
 # Create connection arguments based on database type
 # SQLite needs special handling for multi-threaded apps
 connect_args = {"check_same_thread": False} if is_sqlite else {}
 
+# PostgreSQL: prepared statements and query plans
+#
+#   A PREPARED statement is parsed and planned by PostgreSQL once per
+#   connection; later runs only send the values. psycopg (v3) prepares a
+#   query automatically after it has run prepare_threshold times.
+#
+#   plan_cache_mode decides whether a prepared statement reuses one
+#   "generic" plan or gets a plan for each set of values.
+#   force_custom_plan helps when filters like status/priority are very
+#   uneven (e.g. 95% of tasks are "completed").
+#
+#   Behind an external pooler both are turned off: prepared statements
+#   don't survive switching server connections, and PgBouncer rejects
+#   the "options" startup parameter.
+#
+if is_postgres and not uses_external_pooler:
+    if settings.db_plan_cache_mode:
+        connect_args["options"] = f"-c plan_cache_mode={settings.db_plan_cache_mode}"
+
+    if db_url.get_driver_name() == "psycopg":
+        connect_args["prepare_threshold"] = settings.db_prepare_threshold
+
+if uses_external_pooler and db_url.get_driver_name() == "psycopg":
+    # None = never prepare statements
+    connect_args["prepare_threshold"] = None
+
+# Connection pool settings (PostgreSQL)
+# QueuePool keeps up to pool_size + max_overflow connections and hands
+# them out to requests. Sizes come from settings so they can be tuned
+# in .env without code changes.
+#
+# SQLite keeps SQLAlchemy's default pool. For a database FILE (like the
+# default sqlite:///./task_management.db) that is also a QueuePool, but
+# with SQLAlchemy's own sizes: 5 connections + 10 overflow, so at most
+# 15 at once, shared by all threads. Each request still checks out its
+# own connection, so two requests never share a transaction.
+# (Only an in-memory ":memory:" database gets SingletonThreadPool.)
+#
+# Behind an external pooler we use NullPool: the pooler already keeps
+# the server connections open, "connecting" to it is cheap.
+if is_sqlite:
+    pool_kwargs = {}
+elif uses_external_pooler:
+    pool_kwargs = {"poolclass": NullPool}
+else:
+    pool_kwargs = {
+        "poolclass": QueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_use_lifo": settings.db_pool_use_lifo,
+        "pool_reset_on_return": settings.db_pool_reset_on_return,
+    }
+
 # Create the database engine
 # This doesn't connect yet - it just holds the configuration
 engine = create_engine(
-    # The database URL from our settings (.env file)
-    settings.database_url,
+    # The database URL from our settings (.env file),
+    # minus the pooler flags handled above
+    db_url,
 
-    # echo=True prints SQL commands to console (great for learning!)
-    # We enable this in debug mode, disable in production
-    echo=settings.debug,
+    # echo=False: SQL logging is switched on/off through the
+    # "sqlalchemy.engine" logger below instead (see SQL LOGGING)
+    echo=False,
 
     # Extra connection arguments (SQLite thread safety)
-    connect_args=connect_args
+    connect_args=connect_args,
+
+    # How many compiled SQL statements to keep (see config.py)
+    query_cache_size=settings.db_query_cache_size,
+
+    # Connection pool configuration (empty for SQLite)
+    **pool_kwargs
 )
 
 
+# ----------------------------------------------------------------------------
+# SQL LOGGING
+# ----------------------------------------------------------------------------
+#
+# SQLAlchemy logs every SQL statement to the "sqlalchemy.engine" logger
+# at INFO level. Setting the logger's level decides if they're shown:
+#   - DEBUG=True  → INFO: every statement is logged (great for learning!)
+#   - DEBUG=False → WARNING: statements are skipped before any text is
+#                   formatted (a single number comparison per statement)
+#
+logging.getLogger("sqlalchemy.engine").setLevel(
+    logging.INFO if DEBUG else logging.WARNING
+)
+
+
+# ----------------------------------------------------------------------------
+# SQLITE PERFORMANCE SETTINGS (PRAGMAs)
+# ----------------------------------------------------------------------------
+#
+# WHAT IS A PRAGMA?
+#   A SQLite-specific command that changes how the database behaves.
+#
+# WHY?
+#   SQLite's defaults are very cautious: every commit waits for the disk
+#   (fsync) and writers block readers. The PRAGMAs in
+#   settings.sqlite_pragmas (see config.py) make commits much cheaper.
+#
+# HOW?
+#   @event.listens_for(engine, "connect") runs our function every time
+#   the engine opens a NEW connection to the database file.
+#
+
+if is_sqlite:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Apply settings.sqlite_pragmas to each new SQLite connection."""
+        cursor = dbapi_connection.cursor()
+        for name, value in settings.sqlite_pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
 # ----------------------------------------------------------------------------
 # SESSION MANAGEMENT
 # ----------------------------------------------------------------------------
@@ -154,12 +308,94 @@ def get_session() -> Generator[Session, None, None]:
     """
     # Create a new session using our engine
     # "with" ensures the session closes even if an error occurs
-    with Session(engine) as session:
+    #
+    # expire_on_commit=False: after commit(), objects keep the values
+    # they already have. (By default SQLAlchemy forgets them and the next
+    # attribute access runs another SELECT - wasted for data we just
+    # wrote and are about to send back.)
+    with Session(engine, expire_on_commit=False) as session:
         # yield = "pause here and give this session to the caller"
         # When caller is done, execution continues (session closes)
         yield session
 
 
+def get_engine() -> Engine:
+    """
+    Give READ-ONLY API endpoints the engine (not a connection).
+
+    Why not hand out a connection directly?
+        A dependency's connection is taken from the pool when the request
+        starts and only given back after the response is sent - it sits
+        unused while we build JSON. Under heavy traffic the pool runs dry
+        and requests wait (QueuePool timeout).
+        Instead the endpoint borrows a connection only for the query
+        itself, with run_with_connection() below.
+
+    USAGE IN ROUTERS:
+        @router.get("/tasks")
+        async def read_tasks(engine: Engine = Depends(get_engine)):
+            rows = await run_in_threadpool(
+                run_with_connection, engine, get_task_rows, limit=10
+            )
+
+    Returns:
+        Engine: The app's engine (tests override this with their own)
+    """
+    return engine
+
+
+@contextmanager
+def borrow_connection(bind: Union[Engine, Connection]) -> Iterator[Connection]:
+    """
+    Borrow a connection for the duration of a "with" block.
+
+    Args:
+        bind: The engine to borrow the connection from
+              (or an already open Connection, which is used as-is and
+              NOT closed - the caller owns it)
+
+    Example:
+        with borrow_connection(engine) as connection:
+            for row in iter_task_rows(connection):
+                ...
+    """
+    # Already a connection? Use it directly (the caller owns it)
+    if isinstance(bind, Connection):
+        yield bind
+        return
+
+    # "with" gives the connection back to the pool when the block ends
+    with bind.connect() as connection:
+        yield connection
+
+
+def run_with_connection(
+    bind: Union[Engine, Connection], func: Callable[..., T], /, **kwargs
+) -> T:
+    """
+    Borrow a connection just long enough to run func(connection, **kwargs).
+
+    A plain connection (no Session) is all a read needs: a Session's
+    bookkeeping (identity map, change tracking) only matters for writes.
+
+    Args:
+        bind: The engine to borrow the connection from
+              (or an already open Connection, which is used as-is -
+              the tests pass one that is rolled back after each test)
+        func: A function whose first argument is a Connection
+        **kwargs: Passed on to func
+
+    Returns:
+        Whatever func returns
+
+    Example:
+        rows = run_with_connection(engine, get_task_rows, skip=0, limit=10)
+    """
+    # The connection goes back to the pool right after the query
+    with borrow_connection(bind) as connection:
+        return func(connection, **kwargs)
+
+
 @contextmanager
 def get_session_context():
     """
@@ -183,8 +419,8 @@ def get_session_context():
     Yields:
         Session: A database session
     """
-    # Create session
-    session = Session(engine)
+    # Create session (keep loaded values after commit, like get_session)
+    session = Session(engine, expire_on_commit=False)
     try:
         # Give session to the caller
         yield session
@@ -214,6 +450,11 @@ def get_session_context():
 #   For production, you'd use "migrations" (Alembic) to manage schema changes.
 #
 
+# Databases we already created tables in (during this process)
+# Keyed by engine.url, so a second call for the same database is free
+_TABLES_CREATED: set = set()
+
+
 def create_db_and_tables():
     """
     Create all database tables.
@@ -221,7 +462,9 @@ def create_db_and_tables():
     Call this function once at application startup.
     It creates tables for all SQLModel models that have table=True.
 
-    Safe to call multiple times - existing tables won't be modified.
+    Safe to call multiple times - existing tables won't be modified,
+    and after the first call for a database it returns immediately
+    (no "does this table exist?" queries again).
 
     WHAT HAPPENS:
         1. SQLModel.metadata collects all model definitions
@@ -239,7 +482,11 @@ def create_db_and_tables():
     # - metadata = collection of all table definitions
     # - create_all = generate and execute CREATE TABLE statements
     # - engine = where to create the tables
+    if engine.url in _TABLES_CREATED:
+        return
+
     SQLModel.metadata.create_all(engine)
+    _TABLES_CREATED.add(engine.url)
 
 
 # ----------------------------------------------------------------------------
@@ -251,6 +498,14 @@ def create_db_and_tables():
 #   Useful for monitoring and debugging.
 #
 
+# Logger for this module (messages show up as "app.database")
+logger = logging.getLogger(__name__)
+
+# The ping query, built ONCE (reused on every health check)
+# text() turns a plain SQL string into something SQLAlchemy can execute
+_PING = text("SELECT 1")
+
+
 def check_database_connection() -> bool:
     """
     Check if database connection is working.
@@ -265,16 +520,16 @@ def check_database_connection() -> bool:
             print("Database connection failed!")
     """
     try:
-        # Try to create a session and execute a simple query
-        with Session(engine) as session:
+        # Borrow a plain connection from the pool (no Session needed -
+        # we don't track any objects, we just want a round-trip)
+        with engine.connect() as connection:
             # Execute a simple query (SELECT 1)
             # If this works, database is connected
-            session.exec("SELECT 1")
+            connection.execute(_PING)
         return True
     except Exception as e:
         # If any error occurs, connection failed
-        # In production, you'd log this error
-        print(f"Database connection failed: {e}")
+        logger.error("Database connection failed: %s", e)
         return False
 
 
@@ -287,24 +542,34 @@ def check_database_connection() -> bool:
 #    - Created once, used throughout the app
 #    - Reads URL from settings (which reads from .env)
 #
-# 2. SESSION:
+# 2. CONNECTION POOL:
+#    - Reuses open connections instead of reconnecting per request
+#    - Sizes (pool_size, max_overflow, ...) come from settings
+#
+# 3. SESSION:
 #    - A "conversation" with the database
 #    - Open → Do work → Close
 #    - Always close sessions to prevent connection leaks
 #
-# 3. GENERATOR PATTERN:
+# 4. GENERATOR PATTERN:
 #    - Functions that yield values
 #    - FastAPI uses this for dependency injection
 #    - Ensures proper cleanup (session closing)
+#    - get_session for writes
+#    - get_engine + run_with_connection for reads (connection held
+#      only during the query)
+#    - borrow_connection when the connection must stay open longer
+#      (e.g. while a response streams)
 #
-# 4. TABLE CREATION:
+# 5. TABLE CREATION:
 #    - create_db_and_tables() creates all tables
 #    - Called once at startup
-#    - Safe to call multiple times
+#    - Safe to call multiple times (runs once per database per process)
 #
-# 5. SECURITY:
+# 6. SECURITY:
 #    - Database URL comes from .env (not hardcoded)
 #    - SQLite needs special thread settings for FastAPI
-#    - echo=debug only shows SQL in development
+#    - SQLite PRAGMAs (WAL, synchronous=NORMAL) make commits fast
+#    - SQL is only logged in debug mode ("sqlalchemy.engine" logger)
 #
 # ============================================================================
@@ -20,6 +20,19 @@
 #   - :app = the variable name of FastAPI instance
 #   - --reload = restart on code changes (development only)
 #
+# IN PRODUCTION:
+#   WORKER_ID=0 uvicorn app.main:app --loop uvloop --http httptools \
+#       --port 8000 --no-access-log
+#
+#   - --loop uvloop = event loop written in Cython (faster than asyncio's)
+#   - --http httptools = faster HTTP parser
+#     (both are installed by uvicorn[standard])
+#   - --no-access-log = no log line for every single request
+#   - One process per CPU core (Python runs one core per process): start
+#     one such command per core, each with its OWN WORKER_ID and port,
+#     behind a load balancer. Not --workers N: those N processes share
+#     one WORKER_ID, so they could create tasks with the same id.
+#
 # WHAT YOU'LL SEE:
 #   - API docs: http://localhost:8000/docs
 #   - Alternative docs: http://localhost:8000/redoc
@@ -35,18 +48,48 @@
 # FastAPI: The web framework
 from fastapi import FastAPI
 
+
 # contextmanager: For lifespan events (startup/shutdown)
 from contextlib import asynccontextmanager
 
+# anyio: The async library under FastAPI (owns the worker thread pool)
+import anyio
+
+# logging: Python's built-in logging (instead of print)
+import logging
+
 # Our configuration (app name, version, debug)
-from app.config import settings
+from app.config import settings, APP_NAME, APP_VERSION, AUTO_CREATE_TABLES
 
-# Database setup (create tables function)
-from app.database import create_db_and_tables
+# Database setup (create tables function, the engine and its pool)
+from app.database import create_db_and_tables, engine
+
+# QueuePool: The pool type that has a fixed size (see database.py)
+from sqlalchemy.pool import QueuePool
 
 # Our task router (all /tasks endpoints)
 from app.routers import tasks_router
 
+# ORJSONResponse: Turns responses into JSON with orjson (written in Rust,
+# much faster than Python's built-in json module)
+from app.responses import ORJSONResponse
+
+
+# ----------------------------------------------------------------------------
+# LOGGING
+# ----------------------------------------------------------------------------
+#
+# basicConfig() sends log messages to the console with a timestamp.
+# Each module gets its own logger: logging.getLogger(__name__)
+#
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
+)
+
+logger = logging.getLogger(__name__)
+
 
 # ----------------------------------------------------------------------------
 # LIFESPAN CONTEXT MANAGER
@@ -76,7 +119,8 @@ async def lifespan(app: FastAPI):
     - AFTER yield: When the app shuts down (shutdown events)
 
     Startup tasks:
-    - Create database tables if they don't exist
+    - Size the worker thread pool for blocking database calls
+    - Create database tables if they don't exist (not in production)
 
     Shutdown tasks:
     - (None currently, but you could close connections, etc.)
@@ -86,13 +130,26 @@ async def lifespan(app: FastAPI):
     # -------------------------
     # This code runs ONCE when the server starts
 
-    print("[STARTUP] Starting up...")
+    logger.info("Starting up...")
+
+    # Size the worker thread pool that runs our blocking database calls
+    # (each one holds a thread while it waits on the database).
+    # Not set in .env? Use one thread per connection the pool can hand
+    # out: pool_size + max_overflow (other pools keep anyio's default)
+    threadpool_size = settings.threadpool_size
+    if threadpool_size is None and isinstance(engine.pool, QueuePool):
+        threadpool_size = engine.pool.size() + engine.pool._max_overflow
+    if threadpool_size is not None:
+        limiter = anyio.to_thread.current_default_thread_limiter()
+        limiter.total_tokens = threadpool_size
 
     # Create database tables
     # This is safe to call multiple times - only creates if not exists
-    print("[STARTUP] Creating database tables...")
-    create_db_and_tables()
-    print("[STARTUP] Database tables ready!")
+    # Skipped in production: there the schema comes from migrations (Alembic)
+    if AUTO_CREATE_TABLES:
+        logger.info("Creating database tables...")
+        create_db_and_tables()
+        logger.info("Database tables ready!")
 
     # yield = "pause here, let the app run"
     # Everything after this runs on shutdown
@@ -103,7 +160,7 @@ async def lifespan(app: FastAPI):
     # -------------------------
     # This code runs ONCE when the server shuts down
 
-    print("[SHUTDOWN] Shutting down...")
+    logger.info("Shutting down...")
     # Add cleanup code here if needed
     # Examples: close database connections, flush caches, etc.
 
@@ -147,6 +204,10 @@ A RESTful API for managing tasks with full CRUD operations.
 
     # Debug mode from settings
     debug=settings.debug,
+
+    # Every endpoint encodes its JSON with orjson instead of stdlib json
+    # (handles datetime and our str Enums natively, no Python fallback)
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -196,8 +257,8 @@ def root():
     ```
     """
     return {
-        "message": f"Welcome to {settings.app_name}",
-        "version": settings.app_version,
+        "message": f"Welcome to {APP_NAME}",
+        "version": APP_VERSION,
         "docs": "/docs",
         "status": "healthy"
     }
@@ -217,17 +278,27 @@ def root():
 #    - Code before yield = startup
 #    - Code after yield = shutdown
 #
-# 3. ROUTER REGISTRATION:
+# 3. LOGGING:
+#    - logger.info(...) instead of print()
+#    - Messages can be filtered by level (INFO, WARNING, ERROR)
+#
+# 4. RESPONSE CLASS:
+#    - default_response_class=ORJSONResponse for every endpoint
+#    - orjson = fast JSON encoding (see app/responses.py)
+#
+# 5. ROUTER REGISTRATION:
 #    - app.include_router(router) activates endpoints
 #    - Routers can have prefixes (/tasks)
 #
-# 4. RUNNING THE APP:
+# 6. RUNNING THE APP:
 #    - uvicorn app.main:app --reload
 #    - app.main = module path
 #    - :app = variable name
 #    - --reload = auto-restart on changes
+#    - Production: --loop uvloop --http httptools --no-access-log,
+#      one process (with its own WORKER_ID) per CPU core
 #
-# 5. API DOCS:
+# 7. API DOCS:
 #    - /docs = Swagger UI (interactive)
 #    - /redoc = ReDoc (prettier)
 #
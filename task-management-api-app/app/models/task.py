@@ -32,16 +32,36 @@
 # Field: Used to customize column settings (default, nullable, etc.)
 from sqlmodel import SQLModel, Field
 
+# ConfigDict: Pydantic settings for the model class
+from pydantic import ConfigDict
+
 # Optional: Type hint for fields that can be None
 from typing import Optional
 
 # datetime: For date/time fields (created_at, updated_at, due_date)
-# timezone: For timezone-aware timestamps (UTC)
-from datetime import datetime, timezone
+from datetime import datetime
 
 # Enum: For fields with fixed set of allowed values
 from enum import Enum
 
+# threading: Lock so two threads never get the same id
+# time: Current time in milliseconds (the first part of every id)
+import threading
+import time
+
+# SAEnum: SQLAlchemy's column type for enums (native ENUM on PostgreSQL)
+# Index: Database index definition (faster filtering/sorting)
+# text: Raw SQL snippet (used for the partial index condition)
+# func: SQL functions (func.now() = the database's current time)
+# BigInteger: 64-bit integer column (our ids don't fit in 32 bits)
+# TypeDecorator: Wraps a column type to customize how values are loaded
+# Column/Identity: Full column definition with a GENERATED ... AS IDENTITY
+from sqlalchemy import Enum as SAEnum, Index, text, func, BigInteger, TypeDecorator
+from sqlalchemy import Column, Identity
+
+# settings: worker_id (makes ids from different processes unique)
+from app.config import settings
+
 
 # ----------------------------------------------------------------------------
 # ENUMS (Fixed Value Sets)
@@ -89,6 +109,110 @@ class TaskPriority(str, Enum):
     HIGH = "high"
 
 
+# ----------------------------------------------------------------------------
+# ENUM COLUMN TYPE (fast loading)
+# ----------------------------------------------------------------------------
+#
+# The database stores the enum member NAME ('PENDING', 'COMPLETED').
+# When rows are loaded, each name is turned back into a TaskStatus /
+# TaskPriority member - 2 values per row, so thousands on a big list.
+#
+# SAEnum does that through two Python function calls per value.
+# _EnumByName keeps SAEnum for everything else (native ENUM type,
+# saving values) but loads values with ONE prebuilt dict lookup.
+#
+
+class _EnumByName(TypeDecorator):
+    """
+    SAEnum column that loads values with a plain name → member dict.
+
+    Example:
+        sa_type=_EnumByName(TaskStatus, name="taskstatus", native_enum=True)
+    """
+    impl = SAEnum
+    cache_ok = True
+
+    def __init__(self, enum_class, **kwargs):
+        super().__init__(enum_class, **kwargs)
+
+        # {'PENDING': TaskStatus.PENDING, ..., None: None} (NULL stays None)
+        self._by_name = {member.name: member for member in enum_class}
+        self._by_name[None] = None
+
+    def result_processor(self, dialect, coltype):
+        # dict.__getitem__ is called straight from C (no Python function)
+        return self._by_name.__getitem__
+
+
+# ----------------------------------------------------------------------------
+# ID GENERATOR ("Snowflake" ids)
+# ----------------------------------------------------------------------------
+#
+# WHY GENERATE IDS IN PYTHON?
+#   With AUTOINCREMENT, only the database knows a new row's id, so every
+#   INSERT has to send it back (RETURNING) - one row at a time.
+#   If Python picks the id BEFORE inserting, many rows can go in ONE
+#   "INSERT ... VALUES (...), (...), ..." with nothing to send back.
+#
+# WHAT DOES AN ID LOOK LIKE? (53-bit integer, always increasing)
+#   | 41 bits: milliseconds since 2024-01-01 | 5 bits: worker | 7 bits: counter |
+#
+#   - Time first → newer tasks have bigger ids (ORDER BY id = oldest first)
+#   - Worker bits → settings.worker_id (WORKER_ID in .env), 0-31.
+#     Give every process that writes tasks its own value, or two of
+#     them can produce the same id.
+#   - Counter → up to 128 ids per millisecond per worker
+#
+# WHY 53 BITS AND NOT 64?
+#   JavaScript numbers are exact only up to 2**53. A bigger id in the
+#   JSON would be silently rounded by browsers (JSON.parse), so a client
+#   could load or delete the WRONG task. 41 bits of milliseconds last
+#   until the year 2093.
+#
+
+_EPOCH_MS = 1704067200000          # 2024-01-01T00:00:00Z
+_WORKER_BITS = 5
+_SEQUENCE_BITS = 7
+_SEQUENCE_MASK = (1 << _SEQUENCE_BITS) - 1
+
+_worker_id = settings.worker_id
+_id_lock = threading.Lock()
+_last_ms = 0
+_sequence = 0
+
+
+def _next_id() -> int:
+    """
+    Return a new unique task id (time-ordered integer below 2**53).
+
+    Example:
+        _next_id()  # 360293647142912
+    """
+    global _last_ms, _sequence
+
+    with _id_lock:
+        now_ms = int(time.time() * 1000)
+
+        # Clock went backwards (or same millisecond): keep counting
+        # from the last timestamp so ids never repeat
+        if now_ms <= _last_ms:
+            now_ms = _last_ms
+            _sequence = (_sequence + 1) & _SEQUENCE_MASK
+            if _sequence == 0:
+                # 128 ids used up in this millisecond → borrow the next one
+                now_ms += 1
+        else:
+            _sequence = 0
+
+        _last_ms = now_ms
+
+        return (
+            ((now_ms - _EPOCH_MS) << (_WORKER_BITS + _SEQUENCE_BITS))
+            | (_worker_id << _SEQUENCE_BITS)
+            | _sequence
+        )
+
+
 # ----------------------------------------------------------------------------
 # TASK MODEL
 # ----------------------------------------------------------------------------
@@ -113,7 +237,7 @@ class Task(SQLModel, table=True):
     3. Default values for optional fields
 
     Attributes:
-        id: Unique identifier (auto-generated)
+        id: Unique identifier (generated in Python, time-ordered)
         title: Task title (required, max 200 chars)
         description: Detailed description (optional)
         status: Current status (pending/in_progress/completed)
@@ -130,6 +254,51 @@ class Task(SQLModel, table=True):
         )
     """
 
+    # -------------------------------------------------------------------------
+    # MODEL CONFIG
+    # -------------------------------------------------------------------------
+    # Task is the DATABASE model - input is validated earlier, by
+    # TaskCreate / TaskUpdate (schemas/task.py). So no extra checks here:
+    #   validate_assignment=False   → task.title = "x" is a plain assignment
+    #   revalidate_instances="never" → a Task passed into another model
+    #                                  isn't validated all over again
+    #   from_attributes=True        → can be built from any object's attributes
+    #
+    model_config = ConfigDict(
+        validate_assignment=False,
+        revalidate_instances="never",
+        from_attributes=True,
+    )
+
+    # -------------------------------------------------------------------------
+    # INDEXES
+    # -------------------------------------------------------------------------
+    # WHAT IS AN INDEX?
+    #   A sorted lookup structure (like a book's index) that lets the
+    #   database jump to matching rows instead of reading the whole table.
+    #
+    #   ix_task_status_priority → WHERE status = ? AND priority = ?
+    #   ix_task_due_date        → ORDER BY due_date / due date ranges
+    #   ix_task_created_at      → ORDER BY created_at (newest first, ...)
+    #   ix_task_open_due_date   → "PARTIAL" index: only tasks that aren't
+    #                             completed, sorted by due date. Smaller,
+    #                             and exactly what "what's due next?" needs.
+    #
+    # NOTE: Enum columns store the member NAME ('COMPLETED'), so the
+    # partial index condition compares against the name.
+    #
+    __table_args__ = (
+        Index("ix_task_status_priority", "status", "priority"),
+        Index("ix_task_due_date", "due_date"),
+        Index("ix_task_created_at", "created_at"),
+        Index(
+            "ix_task_open_due_date",
+            "due_date",
+            postgresql_where=text("status != 'COMPLETED'"),
+            sqlite_where=text("status != 'COMPLETED'"),
+        ),
+    )
+
     # -------------------------------------------------------------------------
     # PRIMARY KEY
     # -------------------------------------------------------------------------
@@ -140,14 +309,32 @@ class Task(SQLModel, table=True):
     #   Like a social security number for your data.
     #
     # PARAMETERS:
-    #   - default=None: Don't require id when creating (database will generate)
-    #   - primary_key=True: This is THE unique identifier
+    #   - default_factory=_next_id: Python picks the id when the Task is
+    #     created (see ID GENERATOR above)
+    #   - sa_column: the full database column
+    #       BigInteger          → 64-bit column (BIGINT on PostgreSQL)
+    #       Identity(...)       → PostgreSQL "GENERATED BY DEFAULT AS
+    #                             IDENTITY": only used when an INSERT
+    #                             leaves id out (e.g. rows added by hand
+    #                             in psql). Faster than the old SERIAL.
+    #                             cache=50 hands out 50 numbers at a time.
+    #                             (SQLite ignores it)
+    #       primary_key=True    → This is THE unique identifier
+    #       default=_next_id    → same generator for Core inserts that
+    #                             don't build Task objects (bulk_insert_tasks)
     #
-    # TYPE: int | None
-    #   - int: It will be an integer
-    #   - | None: Can be None when creating (before database assigns id)
+    # TYPE: int
+    #   - Always known, even before the task is saved
     #
-    id: int | None = Field(default=None, primary_key=True)
+    id: int = Field(
+        default_factory=_next_id,
+        sa_column=Column(
+            BigInteger,
+            Identity(always=False, cache=50),
+            primary_key=True,
+            default=_next_id,
+        ),
+    )
 
     # -------------------------------------------------------------------------
     # REQUIRED FIELDS
@@ -181,16 +368,24 @@ class Task(SQLModel, table=True):
     # status: Current state of the task
     # Type: TaskStatus (our enum above)
     # Default: PENDING (new tasks start as pending)
+    # sa_type: How the column is stored in the database
+    #   PostgreSQL → native ENUM type "taskstatus" (4 bytes, compared as
+    #                a number internally, not letter by letter)
+    #   SQLite     → VARCHAR (SQLite has no enum type)
+    #   Loaded back with _EnumByName's dict lookup (see above)
     status: TaskStatus = Field(
         default=TaskStatus.PENDING,
+        sa_type=_EnumByName(TaskStatus, name="taskstatus", native_enum=True),
         description="Current status of the task"
     )
 
     # priority: How urgent is this task
     # Type: TaskPriority (our enum above)
     # Default: MEDIUM (normal priority)
+    # Stored as native ENUM "taskpriority" on PostgreSQL (same as status)
     priority: TaskPriority = Field(
         default=TaskPriority.MEDIUM,
+        sa_type=_EnumByName(TaskPriority, name="taskpriority", native_enum=True),
         description="Priority level of the task"
     )
 
@@ -208,19 +403,25 @@ class Task(SQLModel, table=True):
     # These track when records were created and modified.
 
     # created_at: When was this task created
-    # default_factory: Calls a function when creating to get current UTC time
-    # This means: automatically set to current time when task is created
-    created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+    # server_default=func.now(): The DATABASE fills in the current time
+    #   when the row is INSERTed - Python doesn't compute anything.
+    # Optional in Python only because the value doesn't exist until the
+    # row is saved; the column itself is NOT NULL.
+    created_at: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
         description="When the task was created"
     )
 
     # updated_at: When was this task last modified
-    # Initially same as created_at
-    # NOTE: You need to manually update this when modifying tasks
-    # (We'll handle this in CRUD operations)
-    updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+    # Initially same as created_at (server_default)
+    # onupdate=func.now(): Every UPDATE of the row also sets this to the
+    #   current time automatically - no manual bookkeeping in CRUD.
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
         description="When the task was last updated"
     )
 
@@ -232,16 +433,24 @@ class Task(SQLModel, table=True):
 # When create_db_and_tables() runs in database.py, SQLModel creates:
 #
 #   CREATE TABLE task (
-#       id INTEGER PRIMARY KEY AUTOINCREMENT,
+#       id BIGINT NOT NULL PRIMARY KEY,    -- value chosen by _next_id()
+#                                          -- PostgreSQL: GENERATED BY DEFAULT
+#                                          --   AS IDENTITY (CACHE 50)
 #       title VARCHAR(200) NOT NULL,
 #       description VARCHAR(1000),
-#       status VARCHAR(11) DEFAULT 'pending',
-#       priority VARCHAR(6) DEFAULT 'medium',
+#       status VARCHAR(11) NOT NULL,    -- PostgreSQL: taskstatus ENUM
+#       priority VARCHAR(6) NOT NULL,   -- PostgreSQL: taskpriority ENUM
 #       due_date DATETIME,
-#       created_at DATETIME NOT NULL,
-#       updated_at DATETIME NOT NULL
+#       created_at DATETIME DEFAULT (CURRENT_TIMESTAMP) NOT NULL,
+#       updated_at DATETIME DEFAULT (CURRENT_TIMESTAMP) NOT NULL
 #   );
 #
+#   CREATE INDEX ix_task_status_priority ON task (status, priority);
+#   CREATE INDEX ix_task_due_date ON task (due_date);
+#   CREATE INDEX ix_task_created_at ON task (created_at);
+#   CREATE INDEX ix_task_open_due_date ON task (due_date)
+#       WHERE status != 'COMPLETED';
+#
 # You write Python, SQLModel writes SQL!
 #
 
@@ -269,9 +478,16 @@ class Task(SQLModel, table=True):
 #    - primary_key=True: unique identifier
 #    - default=X: default value if not provided
 #    - default_factory=func: call function for default
+#    - server_default=func.now(): database sets the value on INSERT
+#    - onupdate=func.now(): database value refreshed on every UPDATE
 #    - max_length=N: limit string length
 #
-# 5. CONVENTIONS:
+# 5. INDEXES:
+#    - __table_args__ holds table-level settings like indexes
+#    - Composite index = several columns in one index
+#    - Partial index = only rows matching a condition
+#
+# 6. CONVENTIONS:
 #    - id as primary key
 #    - created_at/updated_at for tracking
 #    - Enums for fixed value sets
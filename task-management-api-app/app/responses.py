@@ -0,0 +1,183 @@
+# ============================================================================
+# RESPONSE CLASSES (responses.py)
+# ============================================================================
+#
+# WHAT IS THIS FILE?
+#   Custom response classes - how our endpoints turn Python data into
+#   the bytes that are sent back to the client.
+#
+# WHY A CUSTOM CLASS?
+#   FastAPI's default JSONResponse uses Python's built-in json module.
+#   orjson does the same job many times faster (it's written in Rust)
+#   and understands datetime and Enum values without any help.
+#
+# HOW IT'S USED:
+#   1. main.py: FastAPI(default_response_class=ORJSONResponse)
+#      → every endpoint uses it
+#   2. An endpoint can also return ORJSONResponse(data) directly
+#      → FastAPI skips its own response_model processing completely
+#      (await ORJSONResponse.create(data) does the encoding in a worker
+#      thread - for big lists, see below)
+#   3. PydanticResponse(model) sends ONE Pydantic model as JSON,
+#      using Pydantic's own (Rust) JSON encoder
+#
+# ============================================================================
+
+
+# ----------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------
+
+# Any: Type hint for "any kind of value"
+from typing import Any
+
+# orjson: Very fast JSON encoder
+import orjson
+
+# JSONResponse: FastAPI's standard JSON response (we only change render)
+from fastapi.responses import JSONResponse
+
+# run_in_threadpool: Run a blocking function in a worker thread and await it
+from fastapi.concurrency import run_in_threadpool
+
+# BaseModel: Any Pydantic model (TaskRead, ...)
+from pydantic import BaseModel
+
+
+# ----------------------------------------------------------------------------
+# ENCODER
+# ----------------------------------------------------------------------------
+#
+# orjson encodes everything in our responses NATIVELY (in Rust):
+#   dict, list, str, int, None, datetime, and Enum members (→ .value).
+# The default= function is only called for types it doesn't know - for
+# our data that never happens, so there's no per-row Python call.
+#
+# _OPTIONS is combined ONCE here instead of on every call.
+#
+# Deliberately NOT used:
+#   - OPT_NAIVE_UTC / OPT_OMIT_MICROSECONDS would make these responses
+#     format times differently from PydanticResponse (GET /tasks/{id})
+#
+
+_OPTIONS = orjson.OPT_UTC_Z
+
+
+def _default(value: Any) -> str:
+    """Fallback for types orjson can't encode itself: use str(value)."""
+    return str(value)
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Encode content as JSON bytes - the one place our orjson options live.
+
+    Used by ORJSONResponse and by streaming endpoints, which encode
+    their rows one at a time.
+
+    Example:
+        dumps({"id": 1, "status": TaskStatus.PENDING})
+        # b'{"id":1,"status":"pending"}'
+    """
+    # orjson.dumps() returns bytes directly (no extra .encode() step)
+    return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+
+# ----------------------------------------------------------------------------
+# ORJSON RESPONSE
+# ----------------------------------------------------------------------------
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response encoded with orjson.
+
+    Everything else (status code, headers, media type) works exactly
+    like FastAPI's JSONResponse.
+
+    Example:
+        return ORJSONResponse({"tasks": rows, "count": len(rows)})
+
+    Encoding:
+        - datetime → "2024-01-15T10:30:00Z" (OPT_UTC_Z: same "Z" style
+          as Pydantic, so responses look the same as before)
+        - str Enums (TaskStatus, ...) → their value ("pending")
+        - anything else orjson doesn't know → str(value)
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+    @classmethod
+    async def create(cls, content: Any, **kwargs) -> "ORJSONResponse":
+        """
+        Build the response, encoding content in a worker thread.
+
+        Encoding a big list (hundreds of rows) takes milliseconds of pure
+        CPU work. Done in an async endpoint, that time blocks the event
+        loop - no other request makes progress meanwhile. Here it runs
+        in the thread pool instead, and the loop stays free.
+
+        Args:
+            content: The data to send (dicts, lists, ...)
+            **kwargs: Passed on to the constructor (status_code, headers...)
+
+        Example:
+            return await ORJSONResponse.create(
+                {"tasks": rows, "count": total}
+            )
+        """
+        body = await run_in_threadpool(dumps, content)
+
+        # Build an empty response, then put the finished bytes in
+        # (content-length must match the new body)
+        response = cls(None, **kwargs)
+        response.body = body
+        response.headers["content-length"] = str(len(body))
+        return response
+
+
+# ----------------------------------------------------------------------------
+# PYDANTIC RESPONSE
+# ----------------------------------------------------------------------------
+
+class PydanticResponse(JSONResponse):
+    """
+    JSON response for a single Pydantic model.
+
+    Pair it with model_construct(), which builds a model WITHOUT
+    validating it - fine for data that just came out of our database
+    (it was validated when it was written).
+
+    Example:
+        return PydanticResponse(TaskRead.model_construct(**task.model_dump()))
+    """
+
+    def render(self, content: BaseModel) -> bytes:
+        # model_dump_json() = the model's fields as a JSON string
+        return content.model_dump_json(by_alias=True).encode("utf-8")
+
+
+# ----------------------------------------------------------------------------
+# WHAT YOU LEARNED IN THIS FILE
+# ----------------------------------------------------------------------------
+#
+# 1. RESPONSE CLASSES:
+#    - Decide how returned data becomes bytes on the wire
+#    - render() is the only method you need to override
+#
+# 2. ORJSON:
+#    - orjson.dumps() → bytes, much faster than json.dumps()
+#    - Handles datetime, Enum, dict, list natively
+#    - default= is called for anything it doesn't know
+#      (never for our rows - no Python call per value)
+#    - option= flags combined once (_OPTIONS), not per call
+#
+# 3. CPU WORK IN ASYNC CODE:
+#    - Encoding is CPU work - it blocks the event loop while it runs
+#    - await ORJSONResponse.create(data) encodes in a worker thread
+#
+# 4. MODEL_CONSTRUCT:
+#    - Model.model_construct(**data) skips validation
+#    - Only for data you already trust (e.g. read from the database)
+#
+# ============================================================================
@@ -6,6 +6,7 @@
 #   Defines all API endpoints for tasks:
 #   - POST   /tasks      → Create a new task
 #   - GET    /tasks      → Get all tasks
+#   - GET    /tasks/stream → Export every task (streamed)
 #   - GET    /tasks/{id} → Get one task by ID
 #   - PUT    /tasks/{id} → Update a task
 #   - DELETE /tasks/{id} → Delete a task
@@ -17,11 +18,24 @@
 #   4. Function calls CRUD operation
 #   5. Function returns response
 #
+# ASYNC HANDLERS:
+#   Every endpoint is "async def" and runs on the event loop.
+#   The database calls BLOCK (they wait for the database), so each CRUD
+#   call is handed to a worker thread with run_in_threadpool().
+#   While that thread waits, the event loop keeps serving other requests.
+#
 # DEPENDENCY INJECTION:
 #   FastAPI automatically provides database session to each function.
 #   We declare: session: Session = Depends(get_session)
 #   FastAPI handles: creating session, passing it, closing it
 #
+#   Read-only endpoints (GET) take the engine instead:
+#   engine: Engine = Depends(get_engine)
+#   and borrow a plain connection only for the query itself
+#   (run_with_connection). No Session bookkeeping - rows come back as dicts.
+#   Write endpoints' Sessions also only hold a connection from their
+#   first query until commit().
+#
 # ============================================================================
 
 
@@ -33,28 +47,59 @@
 # HTTPException: For returning errors (404, 400, etc.)
 # Depends: For dependency injection (automatic session)
 # status: HTTP status codes (200, 201, 404, etc.)
-from fastapi import APIRouter, HTTPException, Depends, status
+# Response: Plain response (we send cached JSON bytes with it)
+# StreamingResponse: Sends a body piece by piece (see /tasks/stream)
+# Query: Extra rules for query parameters (min/max values)
+# Body: Extra rules for the request body (e.g. max list length)
+# Request: The incoming request (we read its If-None-Match header)
+from fastapi import (
+    APIRouter, HTTPException, Depends, status, Response, Query, Body, Request
+)
+from fastapi.responses import StreamingResponse
+
+# run_in_threadpool: Run a blocking function in a worker thread and await it
+# (uses the same thread pool that main.py sizes with THREADPOOL_SIZE)
+from fastapi.concurrency import run_in_threadpool
 
 # Session: Type hint for database session
 from sqlmodel import Session
 
+# Engine: Type hint for the database engine (read endpoints)
+from sqlalchemy.engine import Engine, Connection
+
 # List: Type hint for list of items
-from typing import List
+# Annotated: Attach extra rules (like Body(...)) to a type hint
+# Iterator/Union: Type hints for the streaming generator
+# Optional: "this type or None"
+from typing import List, Annotated, Iterator, Union, Optional
+
+# partial: Pre-fills some arguments of a function (see _NOT_FOUND)
+from functools import partial
 
-# Database session provider
-from app.database import get_session
+# hashlib: Fingerprint of a response body (its ETag)
+import hashlib
 
-# Task model
-from app.models.task import Task
+# Database session/connection providers
+from app.database import (
+    get_session, get_engine, run_with_connection, borrow_connection
+)
 
 # Task schemas (what API accepts/returns)
 from app.schemas.task import TaskCreate, TaskUpdate, TaskRead, TaskList
 
+# Fast JSON responses we can return directly
+from app.responses import ORJSONResponse, PydanticResponse, dumps
+
+# In-memory cache for finished GET responses
+from app.cache import response_cache
+
 # CRUD operations (database functions)
 from app.crud.task import (
     create_task,
-    get_task,
-    get_tasks,
+    create_tasks_bulk,
+    get_task_row,
+    get_task_page,
+    iter_task_rows,
     update_task,
     delete_task
 )
@@ -74,9 +119,118 @@ from app.crud.task import (
 router = APIRouter(
     prefix="/tasks",          # All routes start with /tasks
     tags=["Tasks"],           # Shows as "Tasks" section in docs
+    # orjson for every route here, even if the router is mounted
+    # in an app without its own default_response_class
+    default_response_class=ORJSONResponse,
 )
 
 
+# ----------------------------------------------------------------------------
+# 404 ERROR
+# ----------------------------------------------------------------------------
+#
+# Three endpoints raise the same "not found" error. _NOT_FOUND is
+# HTTPException with status_code=404 already filled in, so each handler
+# only supplies the message:
+#   raise _NOT_FOUND(detail=f"Task with id {task_id} not found")
+#
+
+_HTTP_404 = status.HTTP_404_NOT_FOUND
+_NOT_FOUND = partial(HTTPException, status_code=_HTTP_404)
+
+
+# ----------------------------------------------------------------------------
+# ETAGS (CONDITIONAL GET)
+# ----------------------------------------------------------------------------
+#
+# Every GET response carries an ETag header: a fingerprint of its body.
+# A client that already has that body sends the fingerprint back:
+#   If-None-Match: "3f2a9c..."
+# If it still matches, we answer 304 Not Modified with NO body - the
+# client reuses its copy. Together with the response cache below, a
+# repeat request costs no database query, no encoding and no body bytes.
+#
+# WHY HASH THE BODY (and not id + updated_at)?
+#   SQLite's CURRENT_TIMESTAMP only has whole seconds: two updates in
+#   the same second would give the same ETag, and a client could keep
+#   an old copy. The hash changes whenever a single byte changes.
+#
+
+def _etag(body: bytes) -> str:
+    """Fingerprint of a response body, in ETag format ("...")."""
+    # blake2b with 8 bytes: fast, and plenty to tell versions apart
+    return '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    """
+    Return a 304 response if the client already has this version.
+
+    If-None-Match may list several ETags ("a", "b"), may mark them weak
+    (W/"a"), or be "*" (any version) - all three count as a match.
+    """
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return None
+
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    if etag in tags or "*" in tags:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED,
+                        headers={"ETag": etag})
+    return None
+
+
+# ----------------------------------------------------------------------------
+# RESPONSE CACHE HELPERS
+# ----------------------------------------------------------------------------
+#
+# GET endpoints keep their finished JSON bytes (and ETag) in
+# response_cache (app/cache.py). A repeated GET skips the database AND
+# JSON encoding. Every successful write clears the cache, so readers
+# never see data older than that write (in this process).
+#
+# A GET reads response_cache.generation BEFORE its query and hands it to
+# _cache_set: if a write cleared the cache meanwhile, the (possibly
+# outdated) answer is sent but not stored.
+#
+# Off unless RESPONSE_CACHE_TTL is set - then _cache_get always misses and
+# _cache_set only adds the ETag.
+#
+
+def _cache_get(key: tuple, request: Request) -> Optional[Response]:
+    """Return the cached response for key (or a 304), or None."""
+    entry = response_cache.get(key)
+    if entry is None:
+        return None
+
+    body, etag = entry
+    return _not_modified(request, etag) or Response(
+        content=body, media_type="application/json", headers={"ETag": etag}
+    )
+
+
+def _cache_set(
+    key: tuple, generation: int, request: Request, response: Response
+) -> Response:
+    """
+    Give the response its ETag and remember it under key.
+
+    generation is response_cache.generation from before the query; if the
+    cache has been cleared since, the response is not remembered.
+
+    Returns the response - or a 304 if the client already has this body.
+    """
+    etag = _etag(response.body)
+    response.headers["ETag"] = etag
+    response_cache.set(key, (response.body, etag), generation)
+    return _not_modified(request, etag) or response
+
+
+def _cache_invalidate_all() -> None:
+    """Forget all cached responses (data has changed)."""
+    response_cache.clear()
+
+
 # ----------------------------------------------------------------------------
 # CREATE TASK ENDPOINT
 # ----------------------------------------------------------------------------
@@ -92,15 +246,15 @@ router = APIRouter(
 
 @router.post(
     "/",                              # Path (combined with prefix = /tasks/)
-    response_model=TaskRead,          # What the response looks like
+    responses={201: {"model": TaskRead}},  # What the response looks like (docs)
     status_code=status.HTTP_201_CREATED,  # 201 = Created successfully
     summary="Create a new task",      # Short description in docs
     description="Create a new task with title and optional fields."
 )
-def create_new_task(
+async def create_new_task(
     task_data: TaskCreate,                      # Request body (validated automatically)
     session: Session = Depends(get_session)     # Database session (injected by FastAPI)
-) -> Task:
+) -> PydanticResponse:
     """
     Create a new task.
 
@@ -126,7 +280,76 @@ def create_new_task(
     """
     # Call CRUD function to create task
     # CRUD handles all database operations
-    return create_task(session=session, task_data=task_data)
+    task = await run_in_threadpool(
+        create_task, session=session, task_data=task_data
+    )
+
+    # A new task changes the list - cached lists are out of date
+    _cache_invalidate_all()
+
+    # Send it back as TaskRead without validating it again
+    # (model_construct skips validation - the data came from our database)
+    return PydanticResponse(
+        TaskRead.model_construct(**task.model_dump()),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+# ----------------------------------------------------------------------------
+# BATCH CREATE ENDPOINT
+# ----------------------------------------------------------------------------
+#
+# POST /tasks/batch
+#
+# Creates many tasks with ONE request and ONE database transaction.
+#
+# Request body: List of TaskCreate (1 to 1000 items)
+# Response: List of TaskRead (same order as the request)
+# Status code: 201 Created
+#
+
+@router.post(
+    "/batch",
+    responses={201: {"model": List[TaskRead]}},
+    status_code=status.HTTP_201_CREATED,
+    summary="Create many tasks",
+    description="Create up to 1000 tasks in one request."
+)
+async def create_new_tasks_batch(
+    # Body(min_length, max_length): FastAPI answers 422 for an empty
+    # list or more than 1000 items, before anything is saved
+    tasks_data: Annotated[List[TaskCreate], Body(min_length=1, max_length=1000)],
+    session: Session = Depends(get_session)
+) -> ORJSONResponse:
+    """
+    Create many tasks at once.
+
+    All tasks are saved together: if one fails, none are saved.
+
+    **Returns:** The created tasks (same order as sent).
+
+    **Example request:**
+    ```json
+    [
+        {"title": "Buy groceries"},
+        {"title": "Walk the dog", "priority": "high"}
+    ]
+    ```
+    """
+    # One add_all() + one commit for the whole list (see crud)
+    tasks = await run_in_threadpool(
+        create_tasks_bulk, session=session, items=tasks_data
+    )
+
+    # New tasks change the list - cached lists are out of date
+    _cache_invalidate_all()
+
+    # Task objects hold TaskRead's fields - dump them without revalidating
+    # (up to 1000 tasks: the JSON is encoded in a worker thread)
+    return await ORJSONResponse.create(
+        [task.model_dump() for task in tasks],
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 # ----------------------------------------------------------------------------
@@ -138,40 +361,141 @@ def create_new_task(
 # Returns a list of all tasks with pagination.
 #
 # Query parameters:
-#   - skip: Number of tasks to skip (default 0)
-#   - limit: Maximum tasks to return (default 100)
+#   - skip: Number of tasks to skip (default 0, never negative)
+#   - limit: Maximum tasks to return (default 100, 1 to 500)
+#   - after_id: Keyset pagination - tasks after this id (optional)
 #
 
 @router.get(
     "/",
-    response_model=TaskList,          # Returns list with count
+    # No response_model here: we return the JSON response ourselves.
+    # responses= still documents the shape in the API docs.
+    responses={200: {"model": TaskList}},
     summary="Get all tasks",
     description="Retrieve a list of all tasks with pagination support."
 )
-def read_tasks(
-    skip: int = 0,                              # Query param: ?skip=10
-    limit: int = 100,                           # Query param: ?limit=20
-    session: Session = Depends(get_session)
-) -> dict:
+async def read_tasks(
+    request: Request,                           # For If-None-Match
+    # Query(default, ge=..., le=...) = query param with limits
+    # FastAPI answers 422 for values outside them, before any SQL runs
+    skip: int = Query(0, ge=0),                 # Query param: ?skip=10
+    limit: int = Query(100, ge=1, le=500),      # Query param: ?limit=20
+    after_id: Optional[int] = Query(None, ge=0),  # Query param: ?after_id=123
+    engine: Engine = Depends(get_engine)
+) -> Response:
     """
     Get a list of all tasks.
 
     **Query parameters:**
     - **skip**: Number of tasks to skip (for pagination)
-    - **limit**: Maximum number of tasks to return (max 100)
+    - **limit**: Maximum number of tasks to return (1-500, default 100)
 
     **Pagination example:**
     - Page 1: `/tasks?skip=0&limit=10`
     - Page 2: `/tasks?skip=10&limit=10`
     - Page 3: `/tasks?skip=20&limit=10`
 
-    **Returns:** Object with `tasks` array and `count`.
+    **Keyset pagination (fast, even for deep pages):**
+    - Page 1: `/tasks?after_id=0&limit=10`
+    - Next pages: `/tasks?after_id=<next_cursor>&limit=10`
+    - Stop when `next_cursor` is null
+
+    **Returns:** Object with `tasks` array (this page), `count`
+    (total number of tasks, across all pages) and `next_cursor`.
+    Send the `ETag` back as `If-None-Match` to get `304 Not Modified`
+    while the page hasn't changed.
+    """
+    # Same page asked for recently? Send the cached JSON (or a 304)
+    cache_key = ("tasks", skip, limit, after_id)
+    cached = _cache_get(cache_key, request)
+    if cached is not None:
+        return cached
+    generation = response_cache.generation
+
+    # Get tasks from database (as plain rows - this endpoint only reads)
+    # (a connection is borrowed from the pool only for this query)
+    # total = number of tasks on ALL pages (SELECT count(*))
+    tasks, total = await run_in_threadpool(
+        run_with_connection, engine, get_task_page,
+        skip=skip, limit=limit, after_id=after_id
+    )
+
+    # next_cursor: the after_id for the next page (keyset mode only)
+    # None when this page wasn't full - there is nothing after it
+    next_cursor = None
+    if after_id is not None and tasks and len(tasks) == limit:
+        next_cursor = tasks[-1]["id"]
+
+    # Return the TaskList shape (tasks + count) straight as orjson.
+    # The rows already hold exactly TaskListItem's fields (the short
+    # version - no description or timestamps), straight from the
+    # database, so FastAPI doesn't need to validate and convert them
+    # again (that per-row pass is the slowest part of a big list).
+    # create() encodes in a worker thread - a 500-row page doesn't block
+    # the event loop while it turns into JSON.
+    response = await ORJSONResponse.create({
+        "tasks": [dict(row) for row in tasks],
+        "count": total,
+        "next_cursor": next_cursor,
+    })
+    return _cache_set(cache_key, generation, request, response)
+
+
+# ----------------------------------------------------------------------------
+# STREAM ALL TASKS ENDPOINT
+# ----------------------------------------------------------------------------
+#
+# GET /tasks/stream
+#
+# Exports EVERY task (full rows, ordered by id) in one response.
+#
+# WHY STREAM?
+#   Building the whole list first means memory grows with the number of
+#   tasks, and the client waits until the last row is encoded.
+#   Here rows are read in batches and each one is sent as soon as it's
+#   encoded - memory stays flat and the first bytes go out right away.
+#
+# NOTE: Declared BEFORE /{task_id}, otherwise "stream" would be taken
+#       as a task id (and rejected, since it isn't a number).
+#
+
+def _stream_tasks(bind: Union[Engine, Connection]) -> Iterator[bytes]:
     """
-    # Get tasks from database
-    tasks = get_tasks(session=session, skip=skip, limit=limit)
+    Produce the export as JSON pieces: {"tasks":[ row , row ... ],"count":n}
+
+    A plain (sync) generator: StreamingResponse runs each step in a
+    worker thread, so the blocking database reads never stall the
+    event loop. The connection stays borrowed until the last row is sent.
+    """
+    yield b'{"tasks":['
+
+    count = 0
+    with borrow_connection(bind) as connection:
+        for row in iter_task_rows(connection):
+            # Comma BEFORE every row except the first
+            if count:
+                yield b","
+            yield dumps(dict(row))
+            count += 1
 
-    # Return as TaskList schema (tasks + count)
-    return {"tasks": tasks, "count": len(tasks)}
+    yield b'],"count":' + str(count).encode() + b"}"
+
+
+@router.get(
+    "/stream",
+    summary="Export all tasks",
+    description="Stream every task as one JSON document (for big exports)."
+)
+async def stream_tasks(engine: Engine = Depends(get_engine)) -> StreamingResponse:
+    """
+    Export all tasks, sent piece by piece.
+
+    **Returns:** `{"tasks": [...], "count": n}` - every task with all
+    its fields (like GET /tasks/{id}), ordered by id.
+
+    Not cached and not paginated: use GET /tasks for pages.
+    """
+    return StreamingResponse(_stream_tasks(engine), media_type="application/json")
 
 
 # ----------------------------------------------------------------------------
@@ -186,38 +510,50 @@ def read_tasks(
 
 @router.get(
     "/{task_id}",                     # Path parameter in URL
-    response_model=TaskRead,
+    responses={200: {"model": TaskRead}},
     summary="Get a task by ID",
     description="Retrieve a single task by its unique identifier."
 )
-def read_task(
+async def read_task(
     task_id: int,                               # Path parameter (from URL)
-    session: Session = Depends(get_session)
-) -> Task:
+    request: Request,                           # For If-None-Match
+    engine: Engine = Depends(get_engine)
+) -> Response:
     """
     Get a single task by ID.
 
     **Path parameter:**
     - **task_id**: The unique identifier of the task
 
-    **Returns:** The task object if found.
+    **Returns:** The task object if found, with an `ETag` header.
+    `304 Not Modified` (no body) if `If-None-Match` has that ETag.
 
     **Raises:** 404 Not Found if task doesn't exist.
 
     **Example:** `GET /tasks/1` returns task with id=1.
     """
-    # Get task from database
-    task = get_task(session=session, task_id=task_id)
+    # Same task asked for recently? Send the cached JSON (or a 304)
+    cache_key = ("task", task_id)
+    cached = _cache_get(cache_key, request)
+    if cached is not None:
+        return cached
+    generation = response_cache.generation
+
+    # Get task from database (as a plain row - this endpoint only reads)
+    task = await run_in_threadpool(
+        run_with_connection, engine, get_task_row, task_id=task_id
+    )
 
     # If task not found, raise 404 error
     # HTTPException stops execution and returns error response
     if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Task with id {task_id} not found"
-        )
+        raise _NOT_FOUND(detail=f"Task with id {task_id} not found")
 
-    return task
+    # The row holds exactly TaskRead's fields - build it without validation
+    return _cache_set(
+        cache_key, generation, request,
+        PydanticResponse(TaskRead.model_construct(**task)),
+    )
 
 
 # ----------------------------------------------------------------------------
@@ -233,15 +569,15 @@ def read_task(
 
 @router.put(
     "/{task_id}",
-    response_model=TaskRead,
+    responses={200: {"model": TaskRead}},
     summary="Update a task",
     description="Update an existing task. Only provided fields are updated."
 )
-def update_existing_task(
+async def update_existing_task(
     task_id: int,                               # From URL path
     task_data: TaskUpdate,                      # From request body
     session: Session = Depends(get_session)
-) -> Task:
+) -> PydanticResponse:
     """
     Update an existing task.
 
@@ -263,16 +599,19 @@ def update_existing_task(
     **Raises:** 404 Not Found if task doesn't exist.
     """
     # Call CRUD function to update
-    task = update_task(session=session, task_id=task_id, task_data=task_data)
+    task = await run_in_threadpool(
+        update_task, session=session, task_id=task_id, task_data=task_data
+    )
 
     # If task not found (CRUD returned None), raise 404
     if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Task with id {task_id} not found"
-        )
+        raise _NOT_FOUND(detail=f"Task with id {task_id} not found")
 
-    return task
+    # The task changed - cached copies are out of date
+    _cache_invalidate_all()
+
+    # Send it back as TaskRead without validating it again
+    return PydanticResponse(TaskRead.model_construct(**task.model_dump()))
 
 
 # ----------------------------------------------------------------------------
@@ -292,7 +631,7 @@ def update_existing_task(
     summary="Delete a task",
     description="Permanently delete a task from the database."
 )
-def delete_existing_task(
+async def delete_existing_task(
     task_id: int,
     session: Session = Depends(get_session)
 ) -> None:
@@ -309,14 +648,16 @@ def delete_existing_task(
     **Warning:** This action cannot be undone!
     """
     # Call CRUD function to delete
-    success = delete_task(session=session, task_id=task_id)
+    success = await run_in_threadpool(
+        delete_task, session=session, task_id=task_id
+    )
 
     # If task not found (CRUD returned False), raise 404
     if not success:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Task with id {task_id} not found"
-        )
+        raise _NOT_FOUND(detail=f"Task with id {task_id} not found")
+
+    # The task is gone - cached copies are out of date
+    _cache_invalidate_all()
 
     # Return nothing (204 No Content)
     # FastAPI handles this automatically when return type is None
@@ -334,27 +675,37 @@ def delete_existing_task(
 # 2. ENDPOINT DECORATORS:
 #    - @router.post("/") → POST /tasks
 #    - @router.get("/") → GET /tasks
+#    - @router.get("/stream") → GET /tasks/stream (before /{id}!)
 #    - @router.get("/{id}") → GET /tasks/{id}
 #    - @router.put("/{id}") → PUT /tasks/{id}
 #    - @router.delete("/{id}") → DELETE /tasks/{id}
 #
-# 3. DEPENDENCY INJECTION:
+# 3. ASYNC + THREADS:
+#    - async def endpoints run on the event loop
+#    - await run_in_threadpool(func, ...) for blocking database calls
+#
+# 4. DEPENDENCY INJECTION:
 #    - session: Session = Depends(get_session)
 #    - FastAPI automatically creates and closes session
+#    - engine: Engine = Depends(get_engine) for reads
 #
-# 4. RESPONSE MODELS:
+# 5. RESPONSE MODELS:
 #    - response_model=TaskRead → validates output
 #    - FastAPI automatically converts to JSON
+#    - Returning a Response yourself skips that step; then
+#      responses={200: {"model": TaskRead}} keeps the API docs right
+#    - StreamingResponse(generator) sends the body piece by piece
 #
-# 5. ERROR HANDLING:
+# 6. ERROR HANDLING:
 #    - HTTPException raises HTTP errors
 #    - status.HTTP_404_NOT_FOUND = 404
 #    - detail= message shown to user
 #
-# 6. STATUS CODES:
+# 7. STATUS CODES:
 #    - 200 OK (default for GET)
 #    - 201 Created (POST success)
 #    - 204 No Content (DELETE success)
+#    - 304 Not Modified (If-None-Match matched the ETag - no body)
 #    - 404 Not Found (doesn't exist)
 #
 # ============================================================================
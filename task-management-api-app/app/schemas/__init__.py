@@ -23,6 +23,7 @@ from app.schemas.task import (
     TaskCreate,
     TaskUpdate,
     TaskRead,
+    TaskListItem,
     TaskList
 )
 
@@ -31,5 +32,6 @@ __all__ = [
     "TaskCreate",
     "TaskUpdate",
     "TaskRead",
+    "TaskListItem",
     "TaskList"
 ]
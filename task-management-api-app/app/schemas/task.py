@@ -36,6 +36,9 @@
 # Field: For setting validation rules
 from sqlmodel import SQLModel, Field
 
+# ConfigDict: Pydantic model settings (frozen, extra, ...)
+from pydantic import ConfigDict
+
 # Optional: For fields that can be None
 from typing import Optional, List
 
@@ -146,7 +149,11 @@ class TaskCreate(TaskBase):
     """
     # Inherits all fields from TaskBase
     # No additional fields needed for create
-    pass
+
+    # frozen=True: Request data is read-only once validated
+    #   (nobody needs to change it - CRUD just copies it into a Task)
+    # extra="ignore": Unknown fields in the request body are dropped
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
 
 # ----------------------------------------------------------------------------
@@ -185,6 +192,12 @@ class TaskUpdate(SQLModel):
             "due_date": "2024-12-31T23:59:59"
         }
     """
+    # frozen=True: Read-only after validation (same as TaskCreate)
+    # extra="forbid": Unknown fields are rejected with 422
+    #   (a typo like {"stauts": "completed"} would otherwise be dropped
+    #   and the request would "succeed" without changing anything)
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     # ALL fields are Optional for updates
     # None means "don't change this field"
 
@@ -260,6 +273,42 @@ class TaskRead(TaskBase):
     updated_at: datetime
 
 
+# ----------------------------------------------------------------------------
+# LIST ITEM SCHEMA
+# ----------------------------------------------------------------------------
+#
+# USED WHEN: Tasks are shown in a list (GET /tasks)
+#
+# WHY NOT TaskRead?
+#   A list view only needs enough to show one line per task.
+#   Leaving out description (up to 1000 characters) and the timestamps
+#   makes each row much smaller - less to read from the database,
+#   less JSON to build, less data over the network.
+#   The full task is one GET /tasks/{id} away.
+#
+
+class TaskListItem(SQLModel):
+    """
+    Schema for one task in a list response (the short version).
+
+    Used with: GET /tasks
+
+    Example:
+        {
+            "id": 1,
+            "title": "Buy groceries",
+            "status": "pending",
+            "priority": "high",
+            "due_date": null
+        }
+    """
+    id: int
+    title: str
+    status: TaskStatus
+    priority: TaskPriority
+    due_date: Optional[datetime] = None
+
+
 # ----------------------------------------------------------------------------
 # LIST SCHEMA
 # ----------------------------------------------------------------------------
@@ -278,8 +327,10 @@ class TaskList(SQLModel):
     Used with: GET /tasks (list all tasks)
 
     Includes:
-        - tasks: List of task objects
-        - count: Total number of tasks returned
+        - tasks: List of tasks (short version, see TaskListItem)
+        - count: Total number of tasks (all pages, not just this one)
+        - next_cursor: Pass as ?after_id= to get the next page
+                       (keyset pagination; null = no more pages)
 
     Example response:
         {
@@ -287,11 +338,16 @@ class TaskList(SQLModel):
                 {"id": 1, "title": "Task 1", ...},
                 {"id": 2, "title": "Task 2", ...}
             ],
-            "count": 2
+            "count": 57,
+            "next_cursor": 2
         }
     """
-    tasks: List[TaskRead]
-    count: int = Field(description="Number of tasks in the list")
+    tasks: List[TaskListItem]
+    count: int = Field(description="Total number of tasks (all pages)")
+    next_cursor: Optional[int] = Field(
+        default=None,
+        description="after_id for the next page (null = last page)"
+    )
 
 
 # ----------------------------------------------------------------------------
@@ -306,6 +362,7 @@ class TaskList(SQLModel):
 #    - TaskCreate: Fields needed to create (no id, no timestamps)
 #    - TaskUpdate: All fields optional (update only what you send)
 #    - TaskRead: All fields including id, timestamps (what API returns)
+#    - TaskListItem: Only the columns a list view needs
 #
 # 3. INHERITANCE:
 #    - TaskBase contains common fields
@@ -317,7 +374,12 @@ class TaskList(SQLModel):
 #    - Field(...): Required field (no default)
 #    - Optional[X]: Can be None
 #
-# 5. WHY THIS MATTERS:
+# 5. MODEL CONFIG:
+#    - frozen=True: Request schemas are read-only after validation
+#    - extra="ignore": Unknown request fields are dropped (TaskCreate)
+#    - extra="forbid": Unknown fields are a 422 error (TaskUpdate)
+#
+# 6. WHY THIS MATTERS:
 #    - Security: Prevents users from setting id or timestamps
 #    - Flexibility: Different rules for different operations
 #    - Documentation: FastAPI generates docs from schemas
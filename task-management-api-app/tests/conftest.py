@@ -19,7 +19,9 @@
 #   Tests use an IN-MEMORY SQLite database.
 #   This means:
 #   - Super fast (no disk writes)
-#   - Fresh database for each test
+#   - Tables are created ONCE for the whole test run
+#   - Each test runs inside a transaction that is rolled back afterwards,
+#     so every test still starts with an empty database
 #   - Doesn't affect your real database
 #
 # ============================================================================
@@ -32,18 +34,40 @@
 # pytest: Testing framework
 import pytest
 
+# os: Read the pytest-xdist worker name (PYTEST_XDIST_WORKER)
+import os
+
+# json: Encode the sample task's request body once (see SAMPLE_TASK_DATA)
+import json
+
 # FastAPI testing tools
 from fastapi.testclient import TestClient
 
+# httpx: Async HTTP client (sends requests straight to the app, no server)
+import httpx
+
 # SQLModel database tools
 from sqlmodel import Session, SQLModel, create_engine
 from sqlmodel.pool import StaticPool
 
+# event: Hook into connection events (SQLite transaction fix-up below)
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
 # Our application
 from app.main import app
 
-# Database session dependency (we'll override this)
-from app.database import get_session
+# Test database URL (TEST_DATABASE_URL, or in-memory SQLite by default)
+from app.config import EFFECTIVE_TEST_DB_URL
+
+# Database session/connection dependencies (we'll override these)
+from app.database import get_session, get_engine
+
+# Response cache (emptied for every test)
+from app.cache import response_cache
+
+# Task model (seeded_tasks inserts rows directly)
+from app.models.task import Task
 
 
 # ----------------------------------------------------------------------------
@@ -58,34 +82,102 @@ from app.database import get_session
 #   - Doesn't interfere with real data
 #
 
-# Connection string for in-memory SQLite
-# "sqlite://" without a file path = in-memory database
-TEST_DATABASE_URL = "sqlite://"
+# Connection string for the test database
+# Default: "sqlite:///:memory:" = in-memory database (no file)
+# Set TEST_DATABASE_URL in .env to use a different database
+TEST_DATABASE_URL = EFFECTIVE_TEST_DB_URL
+
+# PARALLEL RUNS (pytest -n auto, needs pytest-xdist):
+#   Every worker is a separate process ("gw0", "gw1", ...).
+#   In-memory SQLite is already private to each process. A SQLite FILE
+#   would be shared, so each worker gets its own: test.db → test_gw0.db
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+_test_url = make_url(TEST_DATABASE_URL)
+if (
+    _XDIST_WORKER
+    and _test_url.get_backend_name() == "sqlite"
+    and _test_url.database not in (None, "", ":memory:")
+):
+    _stem, _ext = os.path.splitext(_test_url.database)
+    TEST_DATABASE_URL = _test_url.set(
+        database=f"{_stem}_{_XDIST_WORKER}{_ext}"
+    ).render_as_string(hide_password=False)
+
+# SQLite needs check_same_thread=False (TestClient runs in another thread)
+TEST_CONNECT_ARGS = (
+    {"check_same_thread": False}
+    if TEST_DATABASE_URL.startswith("sqlite")
+    else {}
+)
+
+
+# ----------------------------------------------------------------------------
+# DEPENDENCY OVERRIDES
+# ----------------------------------------------------------------------------
+#
+# Defined ONCE at module level (not inside client_fixture), so every test
+# installs the very same function objects. The fixtures only swap what
+# they return via _current.
+#
+
+# The session/connection of the running test (filled in by client_fixture)
+_current = {}
+
+
+def get_session_override():
+    """Replacement for get_session: hand out the test's session."""
+    return _current["session"]
+
+
+def get_engine_override():
+    """
+    Replacement for get_engine: hand out the test's connection.
+
+    Read endpoints run their queries on it directly (see
+    run_with_connection), so they see the rows written by the test's
+    session even though nothing is ever really committed.
+    """
+    return _current["connection"]
 
 
 # ----------------------------------------------------------------------------
 # DATABASE FIXTURES
 # ----------------------------------------------------------------------------
 
-@pytest.fixture(name="engine")
+@pytest.fixture(name="engine", scope="session")
 def engine_fixture():
     """
-    Create a test database engine.
+    Create the test database engine (ONCE for the whole test run).
 
     Uses in-memory SQLite with StaticPool.
     StaticPool ensures the same connection is reused
     (required for in-memory SQLite to persist data during test).
 
+    Building the tables once instead of for every test is what keeps
+    a large test suite fast. Isolation comes from connection_fixture.
+
     Yields:
         Engine: SQLAlchemy engine for test database
     """
     # Create engine with special settings for testing
     engine = create_engine(
         TEST_DATABASE_URL,
-        connect_args={"check_same_thread": False},  # Allow multi-thread access
+        connect_args=TEST_CONNECT_ARGS,  # Allow multi-thread access (SQLite)
         poolclass=StaticPool,  # Keep single connection alive
     )
 
+    # SQLite: let SQLAlchemy (not the sqlite3 module) start transactions.
+    # The sqlite3 module's own transaction handling doesn't work with
+    # SAVEPOINT, which connection_fixture relies on.
+    if engine.dialect.name == "sqlite":
+        @event.listens_for(engine, "connect")
+        def _disable_sqlite3_transactions(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine, "begin")
+        def _begin(connection):
+            connection.exec_driver_sql("BEGIN")
+
     # Create all tables in test database
     SQLModel.metadata.create_all(engine)
 
@@ -96,8 +188,52 @@ def engine_fixture():
     SQLModel.metadata.drop_all(engine)
 
 
+@pytest.fixture(name="connection")
+def connection_fixture(engine, request):
+    """
+    Open a connection and start a transaction that is never committed.
+
+    Everything a test writes happens inside this transaction and is
+    thrown away by the rollback afterwards - much cheaper than dropping
+    and re-creating every table.
+
+    Tests marked @pytest.mark.ro (read-only) skip the transaction:
+    there is nothing to undo. On SQLite the connection is switched to
+    "PRAGMA query_only" for them, so a write in an ro test fails loudly
+    instead of leaking into the tests that run after it.
+
+    Args:
+        engine: The test database engine (from engine_fixture)
+        request: pytest's info about the running test (for the marker)
+
+    Yields:
+        Connection: Connection with an open transaction
+                    (or a read-only connection for ro tests)
+    """
+    read_only = (
+        request.node.get_closest_marker("ro") is not None
+        and engine.dialect.name == "sqlite"
+    )
+
+    with engine.connect() as connection:
+        if read_only:
+            connection.exec_driver_sql("PRAGMA query_only = ON")
+            try:
+                yield connection
+            finally:
+                connection.exec_driver_sql("PRAGMA query_only = OFF")
+            return
+
+        transaction = connection.begin()
+
+        yield connection
+
+        # Cleanup: Undo everything the test wrote
+        transaction.rollback()
+
+
 @pytest.fixture(name="session")
-def session_fixture(engine):
+def session_fixture(connection):
     """
     Create a database session for tests.
 
@@ -105,13 +241,24 @@ def session_fixture(engine):
     Each test gets a fresh session.
 
     Args:
-        engine: The test database engine (from engine_fixture)
+        connection: Connection with the test's transaction
+            (from connection_fixture)
 
     Yields:
         Session: Database session for test operations
+
+    join_transaction_mode="create_savepoint":
+        session.commit() (called by our CRUD functions) only releases a
+        SAVEPOINT inside the test's transaction, so the rollback in
+        connection_fixture still undoes it.
     """
-    # Create session connected to test engine
-    with Session(engine) as session:
+    # Create session connected to the test's connection
+    # (expire_on_commit=False, same as the app's get_session)
+    with Session(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    ) as session:
         yield session
 
 
@@ -119,8 +266,30 @@ def session_fixture(engine):
 # CLIENT FIXTURE
 # ----------------------------------------------------------------------------
 
+@pytest.fixture(name="app_client", scope="session")
+def app_client_fixture():
+    """
+    Create ONE test client for the whole test run.
+
+    The client and the dependency overrides never change between tests -
+    only the database they point at does (see client_fixture) - so
+    there's no need to rebuild them for every test.
+
+    Yields:
+        TestClient: Client for making test requests
+    """
+    # Replace real dependencies with test versions
+    app.dependency_overrides[get_session] = get_session_override
+    app.dependency_overrides[get_engine] = get_engine_override
+
+    yield TestClient(app)
+
+    # Cleanup: Remove the overrides
+    app.dependency_overrides.clear()
+
+
 @pytest.fixture(name="client")
-def client_fixture(session):
+def client_fixture(app_client, session, connection):
     """
     Create a test client for making HTTP requests to the API.
 
@@ -130,36 +299,100 @@ def client_fixture(session):
     - Behaves like a real HTTP client
 
     Args:
+        app_client: The shared client (from app_client_fixture)
         session: Test database session (from session_fixture)
+        connection: The test's connection (from connection_fixture)
 
     Yields:
         TestClient: Client for making test requests
 
     How it works:
-        1. Override the get_session dependency
-        2. Make it return our test session instead
-        3. All API requests now use test database
+        1. get_session and get_engine are already overridden (app_client)
+        2. Point the overrides at THIS test's session and connection
+        3. All API requests now use this test's transaction, which is
+           rolled back afterwards (connection_fixture)
     """
-    # Function to override get_session dependency
-    def get_session_override():
-        return session
+    # Point the module-level overrides at this test's database
+    _current["session"] = session
+    _current["connection"] = connection
 
-    # Replace real get_session with test version
-    app.dependency_overrides[get_session] = get_session_override
-
-    # Create test client
-    client = TestClient(app)
+    # Start with an empty response cache (no answers from earlier tests)
+    response_cache.clear()
 
     # Provide client to tests
-    yield client
+    yield app_client
 
-    # Cleanup: Remove the override
-    app.dependency_overrides.clear()
+    # Cleanup: Forget this test's session/connection
+    _current.clear()
+
+
+@pytest.fixture(name="async_client")
+async def async_client_fixture(client):
+    """
+    Create an ASYNC test client (for "async def" tests).
+
+    Same app, same test database as client (it depends on client_fixture
+    for that), but requests are awaited - so a test can send several at
+    once with asyncio.gather().
+
+    Args:
+        client: The sync client fixture (sets up the test database)
+
+    Yields:
+        httpx.AsyncClient: Client for making awaitable test requests
+
+    CAREFUL:
+        All requests of one test share ONE database session/connection
+        (that's how its transaction gets rolled back). Those aren't safe
+        to use from several threads at once, so only gather() requests
+        that don't reach the database - e.g. ones answered from the
+        response cache or rejected by validation.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://test"
+    ) as async_client:
+        yield async_client
+
+
+@pytest.fixture(name="response_cache_on")
+def response_cache_on_fixture(client, monkeypatch):
+    """
+    Turn the response cache on for one test.
+
+    The cache is off by default (RESPONSE_CACHE_TTL=0), so tests of the
+    cache itself switch it on with a 30 second TTL. monkeypatch puts
+    the old TTL back when the test ends.
+
+    Args:
+        client: Test client (from client_fixture - it empties the cache)
+        monkeypatch: pytest's helper for temporary changes
+
+    Example:
+        @pytest.mark.usefixtures("response_cache_on")
+        def test_something(client): ...
+    """
+    monkeypatch.setattr(response_cache, "ttl", 30)
 
 
 # ----------------------------------------------------------------------------
 # HELPER FIXTURES
 # ----------------------------------------------------------------------------
+#
+# SAMPLE_TASK_DATA is the body sample_task_fixture sends. It never
+# changes, so it's built - and encoded to JSON bytes - ONCE here instead
+# of in every test that uses sample_task.
+#
+
+SAMPLE_TASK_DATA = {
+    "title": "Test Task",
+    "description": "A task for testing",
+    "status": "pending",
+    "priority": "medium"
+}
+_SAMPLE_TASK_BODY = json.dumps(SAMPLE_TASK_DATA).encode()
+_JSON_HEADERS = {"content-type": "application/json"}
+
 
 @pytest.fixture(name="sample_task")
 def sample_task_fixture(client):
@@ -177,21 +410,63 @@ def sample_task_fixture(client):
     Returns:
         dict: The created task data including id
     """
-    # Create a sample task
-    task_data = {
-        "title": "Test Task",
-        "description": "A task for testing",
-        "status": "pending",
-        "priority": "medium"
-    }
-
     # Make POST request to create task
-    response = client.post("/tasks/", json=task_data)
+    # (content= sends the pre-encoded bytes as they are - no json.dumps)
+    response = client.post(
+        "/tasks/", content=_SAMPLE_TASK_BODY, headers=_JSON_HEADERS
+    )
 
     # Return the created task (includes id)
     return response.json()
 
 
+@pytest.fixture(name="seeded_tasks")
+def seeded_tasks_fixture(session):
+    """
+    Insert many tasks at once, straight into the database.
+
+    Much cheaper than a loop of client.post() calls: no HTTP, no JSON,
+    no validation - one add_all() and ONE commit.
+
+    Args:
+        session: Test database session (from session_fixture)
+
+    Returns:
+        Callable: seed(n) → the n new Task objects, titled
+                  "Task 0" ... "Task n-1" (ids in the same order)
+
+    Example:
+        def test_something(client, seeded_tasks):
+            tasks = seeded_tasks(5)
+    """
+    def seed(n: int) -> list:
+        tasks = [Task(title=f"Task {i}") for i in range(n)]
+        session.add_all(tasks)
+        session.commit()
+        return tasks
+
+    return seed
+
+
+@pytest.fixture(name="health_response", scope="module")
+def health_response_fixture(app_client):
+    """
+    Call GET / once per test module and keep the answer.
+
+    The health check never touches the database, so it can use the
+    shared app_client directly (no per-test transaction needed), and
+    every test that asks for it reuses the same result.
+
+    Args:
+        app_client: The shared client (from app_client_fixture)
+
+    Returns:
+        tuple: (status_code, parsed JSON body)
+    """
+    response = app_client.get("/")
+    return response.status_code, response.json()
+
+
 # ----------------------------------------------------------------------------
 # WHAT YOU LEARNED IN THIS FILE
 # ----------------------------------------------------------------------------
@@ -202,18 +477,31 @@ def sample_task_fixture(client):
 #    - yield provides value, code after yield = cleanup
 #
 # 2. TEST DATABASE:
-#    - In-memory SQLite (sqlite://)
+#    - In-memory SQLite (sqlite:///:memory:) unless TEST_DATABASE_URL is set
 #    - StaticPool keeps connection alive
-#    - Fresh database for each test
+#    - scope="session": tables are created once per test run
+#    - Each test's writes are rolled back → empty database for each test
+#    - join_transaction_mode="create_savepoint": commit() inside a test
+#      becomes a SAVEPOINT release, so the rollback still undoes it
+#    - @pytest.mark.ro: read-only test, no transaction (SQLite refuses
+#      its writes with PRAGMA query_only)
 #
 # 3. DEPENDENCY OVERRIDE:
 #    - app.dependency_overrides[func] = replacement
 #    - Makes API use test database
 #    - Critical for isolated testing
+#    - Override functions live at module level (same object every test)
+#    - Installed once for the whole run (app_client, scope="session")
+#
+# 4. FACTORY FIXTURES:
+#    - A fixture can return a function (seeded_tasks(5))
+#    - Test data goes straight into the database, skipping HTTP
 #
-# 4. TEST CLIENT:
+# 5. TEST CLIENT:
 #    - TestClient simulates HTTP requests
 #    - client.get(), client.post(), etc.
 #    - Returns Response objects
+#    - Created once (scope="session"); each test only swaps the database
+#    - async_client: httpx.AsyncClient for "async def" tests
 #
 # ============================================================================
@@ -30,98 +30,97 @@
 # pytest for testing
 import pytest
 
+# asyncio: Send several requests at once (asyncio.gather)
+import asyncio
 
-# ============================================================================
-# CREATE TESTS (POST /tasks)
-# ============================================================================
-
-class TestCreateTask:
-    """Tests for creating tasks (POST /tasks)."""
-
-    def test_create_task_success(self, client):
-        """
-        Test creating a task with valid data.
-
-        GIVEN: Valid task data
-        WHEN: POST /tasks is called
-        THEN: Task is created with status 201
-        """
-        # Arrange: Prepare test data
-        task_data = {
-            "title": "Buy groceries",
-            "description": "Milk, eggs, bread",
-            "priority": "high"
-        }
-
-        # Act: Make the request
-        response = client.post("/tasks/", json=task_data)
+# sqlite3: Lower SQLite's placeholder limit (for the big-batch test)
+import sqlite3
 
-        # Assert: Check the response
-        assert response.status_code == 201  # Created
+# CRUD functions and schemas (for tests that skip the HTTP layer)
+from app.crud import create_tasks_bulk, bulk_insert_tasks, upsert_task
+from app.crud import get_tasks, get_tasks_iter, get_tasks_after
+from app.schemas import TaskCreate
+from app.models.task import Task
 
-        # Check response data
-        data = response.json()
-        assert data["title"] == "Buy groceries"
-        assert data["description"] == "Milk, eggs, bread"
-        assert data["priority"] == "high"
-        assert data["status"] == "pending"  # Default value
-        assert "id" in data  # ID should be generated
-        assert "created_at" in data  # Timestamp should exist
-        assert "updated_at" in data  # Timestamp should exist
+# Database module (for the connection check helper)
+from app import database
 
-    def test_create_task_minimal(self, client):
-        """
-        Test creating a task with only required fields.
+# Settings module and the .env parser (for the .env test)
+from app import config
+from dotenv import dotenv_values
 
-        GIVEN: Only title (required field)
-        WHEN: POST /tasks is called
-        THEN: Task is created with defaults for optional fields
-        """
-        # Only title is required
-        task_data = {"title": "Minimal task"}
-
-        response = client.post("/tasks/", json=task_data)
-
-        assert response.status_code == 201
-
-        data = response.json()
-        assert data["title"] == "Minimal task"
-        assert data["description"] is None  # Default
-        assert data["status"] == "pending"  # Default
-        assert data["priority"] == "medium"  # Default
-
-    def test_create_task_without_title_fails(self, client):
-        """
-        Test that creating a task without title fails.
-
-        GIVEN: Task data without title
-        WHEN: POST /tasks is called
-        THEN: Request fails with 422 (validation error)
-        """
-        # Missing required field: title
-        task_data = {"description": "No title provided"}
+# The GET response cache (for the stale-write test)
+from app.cache import response_cache
 
-        response = client.post("/tasks/", json=task_data)
 
-        # 422 = Unprocessable Entity (validation failed)
-        assert response.status_code == 422
+# ============================================================================
+# CREATE TESTS (POST /tasks)
+# ============================================================================
 
-    def test_create_task_with_invalid_status_fails(self, client):
-        """
-        Test that invalid status value is rejected.
+class TestCreateTask:
+    """Tests for creating tasks (POST /tasks)."""
 
-        GIVEN: Task data with invalid status
+    # One row per scenario: (request body, expected status, expected fields)
+    # expected_fields = fields the response must contain with these values
+    @pytest.mark.parametrize("payload,expected_status,expected_fields", [
+        pytest.param(
+            {"title": "Buy groceries", "description": "Milk, eggs, bread",
+             "priority": "high"},
+            201,
+            {"title": "Buy groceries", "description": "Milk, eggs, bread",
+             "priority": "high", "status": "pending"},  # status = default
+            id="success",
+        ),
+        pytest.param(
+            {"title": "Minimal task"},  # Only title is required
+            201,
+            {"title": "Minimal task", "description": None,
+             "status": "pending", "priority": "medium"},  # All defaults
+            id="minimal",
+        ),
+        pytest.param(
+            {"title": "Ship release", "description": "Tag and publish",
+             "status": "in_progress", "priority": "low",
+             "due_date": "2030-01-31T12:00:00Z"},
+            201,
+            {"title": "Ship release", "description": "Tag and publish",
+             "status": "in_progress", "priority": "low",
+             "due_date": "2030-01-31T12:00:00Z"},  # Every value unchanged
+            id="all_fields",
+        ),
+        pytest.param(
+            {"description": "No title provided"},  # Missing required title
+            422,  # Unprocessable Entity (validation failed)
+            {},
+            id="missing_title",
+        ),
+        pytest.param(
+            {"title": "Test task", "status": "invalid_status"},  # Not an enum value
+            422,
+            {},
+            id="invalid_status",
+        ),
+    ])
+    def test_create_task(self, client, payload, expected_status, expected_fields):
+        """
+        Test creating a task with valid and invalid data.
+
+        GIVEN: A task payload (see the parametrize cases above)
         WHEN: POST /tasks is called
-        THEN: Request fails with 422 (validation error)
+        THEN: The expected status code, and on success the expected
+              fields plus a generated id and timestamps
         """
-        task_data = {
-            "title": "Test task",
-            "status": "invalid_status"  # Not a valid enum value
-        }
+        response = client.post("/tasks/", json=payload)
 
-        response = client.post("/tasks/", json=task_data)
+        assert response.status_code == expected_status
 
-        assert response.status_code == 422
+        if expected_status == 201:
+            data = response.json()
+            # Subset check: every expected (field, value) pair is in data
+            # (a failure shows both dicts, not just the first wrong field)
+            assert expected_fields.items() <= data.items()
+            # Generated by the server: id and timestamps
+            assert {"id", "created_at", "updated_at"} <= data.keys()
 
 
 # ============================================================================
@@ -131,6 +130,7 @@ class TestCreateTask:
 class TestReadTasks:
     """Tests for reading tasks (GET endpoints)."""
 
+    @pytest.mark.ro
     def test_read_tasks_empty(self, client):
         """
         Test getting tasks when database is empty.
@@ -164,6 +164,54 @@ class TestReadTasks:
         assert len(data["tasks"]) == 1
         assert data["tasks"][0]["title"] == "Test Task"
 
+    def test_read_tasks_returns_list_items(self, client, sample_task):
+        """
+        Test that list entries are the short TaskListItem version.
+
+        GIVEN: One task exists
+        WHEN: GET /tasks is called
+        THEN: Each entry has only id, title, status, priority, due_date
+        """
+        response = client.get("/tasks/")
+
+        assert response.status_code == 200
+        assert set(response.json()["tasks"][0]) == {
+            "id", "title", "status", "priority", "due_date"
+        }
+
+    def test_stream_tasks(self, client, seeded_tasks):
+        """
+        Test exporting every task through the streaming endpoint.
+
+        GIVEN: Three tasks exist
+        WHEN: GET /tasks/stream is called
+        THEN: One JSON document with all three full tasks, in id order
+        """
+        seeded_tasks(3)
+
+        response = client.get("/tasks/stream")
+
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["count"] == 3
+        assert [t["title"] for t in data["tasks"]] == ["Task 0", "Task 1", "Task 2"]
+        assert "created_at" in data["tasks"][0]  # Full rows, not list items
+
+    @pytest.mark.ro
+    def test_stream_tasks_empty(self, client):
+        """
+        Test the streaming endpoint with no tasks.
+
+        GIVEN: No tasks in database
+        WHEN: GET /tasks/stream is called
+        THEN: Still valid JSON, with an empty list
+        """
+        response = client.get("/tasks/stream")
+
+        assert response.status_code == 200
+        assert response.json() == {"tasks": [], "count": 0}
+
     def test_read_single_task_success(self, client, sample_task):
         """
         Test getting a single task by ID.
@@ -182,42 +230,66 @@ class TestReadTasks:
         assert data["id"] == task_id
         assert data["title"] == "Test Task"
 
-    def test_read_single_task_not_found(self, client):
+    def test_read_tasks_pagination(self, client, seeded_tasks):
         """
-        Test getting a task that doesn't exist.
+        Test pagination with skip and limit.
 
-        GIVEN: No task with ID 999
-        WHEN: GET /tasks/999 is called
-        THEN: Returns 404 Not Found
+        GIVEN: 5 tasks exist (ids known from the seed)
+        WHEN: GET /tasks?skip=2&limit=2
+        THEN: Exactly the 3rd and 4th tasks, and the total count
         """
-        response = client.get("/tasks/999")
+        # Create 5 tasks (one insert, no HTTP) - we know their ids
+        ids = [task.id for task in seeded_tasks(5)]
 
-        assert response.status_code == 404
+        # One request for a page in the middle
+        data = client.get("/tasks/?skip=2&limit=2").json()
 
-        data = response.json()
-        assert "not found" in data["detail"].lower()
+        assert [t["id"] for t in data["tasks"]] == ids[2:4]
+        assert data["count"] == 5  # Total across all pages
 
-    def test_read_tasks_pagination(self, client):
+    @pytest.mark.ro
+    def test_read_tasks_limit_too_large_fails(self, client):
         """
-        Test pagination with skip and limit.
+        Test that an oversized page is rejected.
 
-        GIVEN: Multiple tasks exist
-        WHEN: GET /tasks with skip/limit params
-        THEN: Returns correct subset
+        GIVEN: The page size is capped at 500
+        WHEN: GET /tasks?limit=501 is called
+        THEN: Returns 422 Validation Error
         """
-        # Create 5 tasks
-        for i in range(5):
-            client.post("/tasks/", json={"title": f"Task {i}"})
+        response = client.get("/tasks/?limit=501")
 
-        # Get first 2 tasks
-        response = client.get("/tasks/?skip=0&limit=2")
-        data = response.json()
-        assert len(data["tasks"]) == 2
+        assert response.status_code == 422
 
-        # Get next 2 tasks
-        response = client.get("/tasks/?skip=2&limit=2")
-        data = response.json()
-        assert len(data["tasks"]) == 2
+    @pytest.mark.ro
+    def test_read_tasks_negative_cursor_fails(self, client):
+        """
+        Test that a negative keyset cursor is rejected.
+
+        GIVEN: Task ids are never negative
+        WHEN: GET /tasks?after_id=-1 is called
+        THEN: Returns 422 Validation Error
+        """
+        response = client.get("/tasks/?after_id=-1")
+
+        assert response.status_code == 422
+
+    def test_read_tasks_keyset_pagination(self, client, seeded_tasks):
+        """
+        Test keyset pagination with after_id and next_cursor.
+
+        GIVEN: 3 tasks exist
+        WHEN: Pages of 2 are followed via next_cursor
+        THEN: All tasks come back once, in id order, then the cursor ends
+        """
+        seeded_tasks(3)
+
+        page1 = client.get("/tasks/?after_id=0&limit=2").json()
+        assert [t["title"] for t in page1["tasks"]] == ["Task 0", "Task 1"]
+        assert page1["next_cursor"] == page1["tasks"][-1]["id"]
+
+        page2 = client.get(f"/tasks/?after_id={page1['next_cursor']}&limit=2").json()
+        assert [t["title"] for t in page2["tasks"]] == ["Task 2"]
+        assert page2["next_cursor"] is None
 
 
 # ============================================================================
@@ -227,146 +299,486 @@ class TestReadTasks:
 class TestUpdateTask:
     """Tests for updating tasks (PUT /tasks/{id})."""
 
-    def test_update_task_success(self, client, sample_task):
+    # (request body, expected status, expected fields)
+    # The task from sample_task has title "Test Task" and
+    # description "A task for testing" - fields not sent must keep them
+    @pytest.mark.parametrize("payload,expected_status,expected_fields", [
+        pytest.param(
+            {"title": "Updated Title", "status": "completed"},
+            200,
+            {"title": "Updated Title", "status": "completed",
+             "description": "A task for testing"},  # Unchanged
+            id="success",
+        ),
+        pytest.param(
+            {"status": "in_progress"},  # Only update status
+            200,
+            {"status": "in_progress", "title": "Test Task"},  # Title unchanged
+            id="partial",
+        ),
+        pytest.param(
+            {"status": "invalid_status"},
+            422,
+            {},
+            id="invalid_status",
+        ),
+        pytest.param(
+            {"stauts": "completed"},  # Misspelled field: 422, not a silent no-op
+            422,
+            {},
+            id="unknown_field",
+        ),
+    ])
+    def test_update_task(
+        self, client, sample_task, payload, expected_status, expected_fields
+    ):
+        """
+        Test updating a task with valid and invalid data.
+
+        GIVEN: A task exists
+        WHEN: PUT /tasks/{id} is called with the payload
+        THEN: The expected status code, and on success only the sent
+              fields change
         """
-        Test updating a task with valid data.
+        response = client.put(f"/tasks/{sample_task['id']}", json=payload)
+
+        assert response.status_code == expected_status
+        assert expected_fields.items() <= response.json().items()
+
+    def test_update_task_empty_body(self, client, sample_task):
+        """
+        Test an update that doesn't change anything.
 
         GIVEN: A task exists
-        WHEN: PUT /tasks/{id} is called with new data
-        THEN: Task is updated successfully
+        WHEN: PUT /tasks/{id} with an empty body
+        THEN: The task comes back unchanged (updated_at too)
         """
         task_id = sample_task["id"]
 
-        update_data = {
-            "title": "Updated Title",
-            "status": "completed"
-        }
-
-        response = client.put(f"/tasks/{task_id}", json=update_data)
+        response = client.put(f"/tasks/{task_id}", json={})
 
         assert response.status_code == 200
+        assert response.json() == sample_task
 
-        data = response.json()
-        assert data["title"] == "Updated Title"
-        assert data["status"] == "completed"
-        # Description should remain unchanged
-        assert data["description"] == "A task for testing"
 
-    def test_update_task_partial(self, client, sample_task):
+# ============================================================================
+# DELETE TESTS (DELETE /tasks/{id})
+# ============================================================================
+
+def test_delete_task_success(client, session, sample_task):
+    """
+    Test deleting a task.
+
+    GIVEN: A task exists
+    WHEN: DELETE /tasks/{id} is called
+    THEN: Task is deleted (204 No Content)
+    """
+    task_id = sample_task["id"]
+
+    response = client.delete(f"/tasks/{task_id}")
+
+    # 204 = No Content (success, nothing to return)
+    assert response.status_code == 204
+
+    # Verify task is gone - straight from the database, no extra
+    # request (GET's 404 answer is covered by test_not_found)
+    assert session.get(Task, task_id) is None
+
+
+# ============================================================================
+# NOT FOUND TESTS (GET/PUT/DELETE /tasks/{id})
+# ============================================================================
+
+@pytest.mark.parametrize("method,kwargs", [
+    pytest.param("get", {}, id="read"),
+    pytest.param("put", {"json": {"title": "New Title"}}, id="update"),
+    pytest.param("delete", {}, id="delete"),
+])
+def test_not_found(client, method, kwargs):
+    """
+    Test every verb on a task that doesn't exist.
+
+    GIVEN: No task with ID 999
+    WHEN: GET/PUT/DELETE /tasks/999 is called
+    THEN: Returns 404 Not Found with the exact error message
+    """
+    response = getattr(client, method)("/tasks/999", **kwargs)
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Task with id 999 not found"}
+
+
+# ============================================================================
+# LIST QUERY TESTS (crud.get_tasks, get_tasks_iter, get_tasks_after)
+# ============================================================================
+
+class TestListQueries:
+    """Tests for the ORM list helpers in app/crud (no HTTP)."""
+
+    def test_get_tasks_iter_streams_in_batches(self, session, seeded_tasks):
         """
-        Test partial update (only some fields).
+        Test that get_tasks_iter hands out every task in id order, in chunks.
 
-        GIVEN: A task exists
-        WHEN: PUT /tasks/{id} with only status
-        THEN: Only status changes, other fields unchanged
+        GIVEN: 300 tasks (more than two batches of 128)
+        WHEN: get_tasks_iter is read batch by batch
+        THEN: Batches of 128, 128 and 44 tasks, together all 300 in id order
         """
-        task_id = sample_task["id"]
-        original_title = sample_task["title"]
+        ids = [t.id for t in seeded_tasks(300)]
 
-        # Only update status
-        update_data = {"status": "in_progress"}
+        batches = list(get_tasks_iter(session, limit=300).partitions())
 
-        response = client.put(f"/tasks/{task_id}", json=update_data)
+        assert [len(batch) for batch in batches] == [128, 128, 44]
+        assert [t.id for batch in batches for t in batch] == ids
 
-        assert response.status_code == 200
+    def test_get_tasks_after_pages_do_not_overlap(self, session, seeded_tasks):
+        """
+        Test keyset paging with get_tasks_after.
+
+        GIVEN: 5 tasks
+        WHEN: Pages of 2 are read, each starting after the last id seen
+        THEN: Pages [0, 1], [2, 3], [4] - no overlap, nothing missed -
+              and nothing after the last id
+        """
+        ids = [t.id for t in seeded_tasks(5)]
+
+        pages, after_id = [], 0
+        while page := get_tasks_after(session, after_id=after_id, limit=2):
+            pages.append([t.id for t in page])
+            after_id = page[-1].id
+
+        assert pages == [ids[0:2], ids[2:4], ids[4:5]]
+        assert get_tasks_after(session, after_id=ids[-1]) == []
+
+    def test_get_tasks_uses_each_calls_skip_and_limit(
+        self, session, seeded_tasks
+    ):
+        """
+        Test that the cached lambda statement in get_tasks takes new values.
+
+        GIVEN: 5 tasks
+        WHEN: get_tasks is called several times with different skip/limit
+        THEN: Each call returns its own slice (not the first call's)
+        """
+        ids = [t.id for t in seeded_tasks(5)]
+
+        def page(skip, limit):
+            return [t.id for t in get_tasks(session, skip=skip, limit=limit)]
+
+        assert page(0, 2) == ids[0:2]
+        assert page(2, 2) == ids[2:4]
+        assert page(1, 10) == ids[1:]
+
+
+# ============================================================================
+# BULK CREATE TESTS (crud.create_tasks_bulk)
+# ============================================================================
+
+class TestBulkCreateTasks:
+    """Tests for creating many tasks in one transaction."""
+
+    def test_create_tasks_bulk(self, session):
+        """
+        Test creating several tasks at once.
+
+        GIVEN: A list of TaskCreate schemas
+        WHEN: create_tasks_bulk() is called
+        THEN: All tasks are saved with ids, in the same order
+        """
+        items = [TaskCreate(title=f"Bulk {i}") for i in range(3)]
+
+        tasks = create_tasks_bulk(session, items)
+
+        assert [t.title for t in tasks] == ["Bulk 0", "Bulk 1", "Bulk 2"]
+        assert all(t.id is not None for t in tasks)
+
+    def test_task_ids_are_assigned_in_order(self, session):
+        """
+        Test that ids are known before saving and increase over time.
+
+        GIVEN: Tasks built one after another
+        WHEN: Their ids are compared
+        THEN: Every id is unique and bigger than the previous one
+        """
+        items = [TaskCreate(title=f"Ordered {i}") for i in range(5)]
+
+        ids = [t.id for t in create_tasks_bulk(session, items)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == 5
+
+    def test_task_ids_fit_in_javascript_numbers(self, session):
+        """
+        Test that ids stay exact in JavaScript clients.
+
+        GIVEN: More tasks than one millisecond's counter can number (128)
+        WHEN: They are created in one batch
+        THEN: Every id is unique and no bigger than 2**53
+        """
+        items = [TaskCreate(title=f"Big batch {i}") for i in range(300)]
+
+        ids = [t.id for t in create_tasks_bulk(session, items)]
+
+        assert len(set(ids)) == 300
+        assert max(ids) <= 2**53
+
+    def test_large_batch_with_sqlite_variable_limit(self, session):
+        """
+        Test a batch bigger than older SQLite builds allow in one query.
+
+        GIVEN: A connection limited to 999 "?" placeholders per statement
+        WHEN: 1000 tasks (the batch endpoint's maximum) are created
+        THEN: All of them come back with their timestamps loaded
+        """
+        if session.get_bind().dialect.name != "sqlite":
+            pytest.skip("SQLite-only limit")
+        dbapi_connection = session.connection().connection.dbapi_connection
+        limit = dbapi_connection.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+        dbapi_connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+        try:
+            items = [TaskCreate(title=f"Huge {i}") for i in range(1000)]
+            tasks = create_tasks_bulk(session, items)
+        finally:
+            dbapi_connection.setlimit(
+                sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, limit
+            )
+
+        assert len(tasks) == 1000
+        assert all(task.created_at is not None for task in tasks)
+
+    def test_create_tasks_batch_endpoint(self, client):
+        """
+        Test creating several tasks through POST /tasks/batch.
+
+        GIVEN: A list of task payloads
+        WHEN: POST /tasks/batch is called
+        THEN: Returns 201 and every task with id and timestamps, in order
+        """
+        payload = [{"title": "First"}, {"title": "Second", "priority": "high"}]
+
+        response = client.post("/tasks/batch", json=payload)
+
+        assert response.status_code == 201
 
         data = response.json()
-        assert data["status"] == "in_progress"
-        assert data["title"] == original_title  # Unchanged
+        assert [t["title"] for t in data] == ["First", "Second"]
+        assert data[1]["priority"] == "high"
+        assert all(t["id"] and t["created_at"] for t in data)
 
-    def test_update_task_not_found(self, client):
+    def test_bulk_insert_tasks(self, client, session):
         """
-        Test updating a task that doesn't exist.
+        Test inserting plain dictionaries in batches.
 
-        GIVEN: No task with ID 999
-        WHEN: PUT /tasks/999 is called
-        THEN: Returns 404 Not Found
+        GIVEN: More rows than one batch holds
+        WHEN: bulk_insert_tasks() is called
+        THEN: Every row is saved, with column defaults applied
         """
-        update_data = {"title": "New Title"}
+        rows = [{"title": f"Row {i}"} for i in range(7)]
 
-        response = client.put("/tasks/999", json=update_data)
+        inserted = bulk_insert_tasks(session, rows, batch_size=3)
 
-        assert response.status_code == 404
+        assert inserted == 7
 
-    def test_update_task_invalid_data(self, client, sample_task):
+        data = client.get("/tasks/").json()
+        assert data["count"] == 7
+        assert data["tasks"][0]["status"] == "pending"  # Default applied
+
+
+def test_upsert_task_inserts_then_updates(session):
+    """
+    Test that the same id is created once and then overwritten.
+
+    GIVEN: An id that doesn't exist yet
+    WHEN: upsert_task() is called twice with that id
+    THEN: The first call creates the task, the second updates it
+    """
+    created = upsert_task(session, {"id": 42, "title": "First"})
+    assert created.title == "First"
+    assert created.status == "pending"  # Default applied on insert
+
+    updated = upsert_task(
+        session, {"id": 42, "title": "Second", "status": "completed"}
+    )
+
+    assert updated.id == 42
+    assert updated.title == "Second"
+    assert updated.status == "completed"
+
+
+@pytest.mark.usefixtures("response_cache_on")
+class TestResponseCache:
+    """Tests for the in-memory GET response cache."""
+
+    def test_read_tasks_is_cached(self, client, session):
         """
-        Test updating with invalid data.
+        Test that a repeated GET /tasks is answered from the cache.
 
-        GIVEN: A task exists
-        WHEN: PUT with invalid status
-        THEN: Returns 422 validation error
+        GIVEN: GET /tasks was already called once
+        WHEN: A task is added behind the API's back and GET /tasks repeats
+        THEN: The cached (old) list is returned
         """
-        task_id = sample_task["id"]
+        assert client.get("/tasks/").json()["count"] == 0
 
-        update_data = {"status": "invalid_status"}
+        bulk_insert_tasks(session, [{"title": "Hidden"}])
 
-        response = client.put(f"/tasks/{task_id}", json=update_data)
+        assert client.get("/tasks/").json()["count"] == 0
 
-        assert response.status_code == 422
+    def test_write_clears_cache(self, client):
+        """
+        Test that a write through the API empties the cache.
+
+        GIVEN: GET /tasks was already called once
+        WHEN: A task is created with POST /tasks
+        THEN: The next GET /tasks includes the new task
+        """
+        assert client.get("/tasks/").json()["count"] == 0
 
+        client.post("/tasks/", json={"title": "Visible"})
 
-# ============================================================================
-# DELETE TESTS (DELETE /tasks/{id})
-# ============================================================================
+        assert client.get("/tasks/").json()["count"] == 1
 
-class TestDeleteTask:
-    """Tests for deleting tasks (DELETE /tasks/{id})."""
+    def test_answer_older_than_a_write_is_not_cached(self, client):
+        """
+        Test that a GET which raced a write doesn't store its answer.
 
-    def test_delete_task_success(self, client, sample_task):
+        GIVEN: A GET noted the cache generation before its query
+        WHEN: A write clears the cache before the GET stores its answer
+        THEN: The answer is not stored
         """
-        Test deleting a task.
+        generation = response_cache.generation
 
-        GIVEN: A task exists
-        WHEN: DELETE /tasks/{id} is called
-        THEN: Task is deleted (204 No Content)
+        response_cache.clear()
+        response_cache.set(("task", 1), (b"{}", '"old"'), generation)
+
+        assert response_cache.get(("task", 1)) is None
+
+
+class TestETag:
+    """Tests for ETag / If-None-Match on the GET endpoints."""
+
+    def test_read_task_not_modified(self, client, sample_task):
         """
-        task_id = sample_task["id"]
+        Test that a matching If-None-Match gets 304 with no body.
+
+        GIVEN: A task was read once (client has its ETag)
+        WHEN: GET /tasks/{id} again with If-None-Match: <that ETag>
+        THEN: 304 Not Modified, empty body
+        """
+        url = f"/tasks/{sample_task['id']}"
+        etag = client.get(url).headers["etag"]
 
-        response = client.delete(f"/tasks/{task_id}")
+        response = client.get(url, headers={"If-None-Match": etag})
 
-        # 204 = No Content (success, nothing to return)
-        assert response.status_code == 204
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
 
-        # Verify task is gone
-        get_response = client.get(f"/tasks/{task_id}")
-        assert get_response.status_code == 404
+    def test_read_task_modified_after_update(self, client, sample_task):
+        """
+        Test that an update gives the task a new ETag.
 
-    def test_delete_task_not_found(self, client):
+        GIVEN: A task was read once (client has its ETag)
+        WHEN: The task is updated and read again with the old ETag
+        THEN: 200 with the new data (not 304)
         """
-        Test deleting a task that doesn't exist.
+        url = f"/tasks/{sample_task['id']}"
+        etag = client.get(url).headers["etag"]
+
+        client.put(url, json={"title": "Changed"})
+        response = client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()["title"] == "Changed"
+        assert response.headers["etag"] != etag
 
-        GIVEN: No task with ID 999
-        WHEN: DELETE /tasks/999 is called
-        THEN: Returns 404 Not Found
+    def test_read_tasks_not_modified(self, client, sample_task):
         """
-        response = client.delete("/tasks/999")
+        Test conditional GET on the task list.
+
+        GIVEN: The list was read once (client has its ETag)
+        WHEN: GET /tasks again with If-None-Match: <that ETag>
+        THEN: 304 Not Modified
+        """
+        etag = client.get("/tasks/").headers["etag"]
+
+        response = client.get("/tasks/", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+
+    @pytest.mark.usefixtures("response_cache_on")
+    async def test_concurrent_revalidation(self, async_client, sample_task):
+        """
+        Test many clients checking the same task at the same time.
+
+        GIVEN: A task was read once (it's in the cache, with an ETag)
+        WHEN: 10 conditional GETs arrive at once
+        THEN: All of them get 304 (answered from the cache)
+        """
+        url = f"/tasks/{sample_task['id']}"
+        etag = (await async_client.get(url)).headers["etag"]
+
+        # All 10 in flight together - none of them touch the database
+        responses = await asyncio.gather(*[
+            async_client.get(url, headers={"If-None-Match": etag})
+            for _ in range(10)
+        ])
 
-        assert response.status_code == 404
+        assert [r.status_code for r in responses] == [304] * 10
 
 
 # ============================================================================
 # HEALTH CHECK TESTS
 # ============================================================================
 
-class TestHealthCheck:
-    """Tests for the health check endpoint."""
+def test_health_check(health_response):
+    """
+    Test the root endpoint returns health status.
 
-    def test_health_check(self, client):
-        """
-        Test the root endpoint returns health status.
+    GIVEN: The API is running
+    WHEN: GET / is called (once per module, see health_response)
+    THEN: Returns health check information
+    """
+    status_code, data = health_response
 
-        GIVEN: The API is running
-        WHEN: GET / is called
-        THEN: Returns health check information
-        """
-        response = client.get("/")
+    assert status_code == 200
+    assert "message" in data
+    assert "version" in data
+    assert data["status"] == "healthy"
 
-        assert response.status_code == 200
 
-        data = response.json()
-        assert "message" in data
-        assert "version" in data
-        assert data["status"] == "healthy"
+def test_check_database_connection(engine, monkeypatch):
+    """
+    Test the database ping helper.
+
+    GIVEN: A working database engine
+    WHEN: check_database_connection() is called
+    THEN: Returns True
+    """
+    # Point the helper at the test database
+    monkeypatch.setattr(database, "engine", engine)
+
+    assert database.check_database_connection() is True
+
+
+def test_settings_read_json_from_env_file(tmp_path, monkeypatch):
+    """
+    Test that a dict setting can be written as JSON in .env.
+
+    GIVEN: A .env file with SQLITE_PRAGMAS={...}
+    WHEN: Settings are built from it
+    THEN: sqlite_pragmas is the decoded dict
+    """
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        'SQLITE_PRAGMAS={"journal_mode": "WAL", "synchronous": "FULL"}\n'
+    )
+    monkeypatch.delenv("SQLITE_PRAGMAS", raising=False)
+    monkeypatch.setattr(config, "_DOTENV_VALUES", dotenv_values(env_file))
+
+    settings = config.build_settings()
+
+    assert settings.sqlite_pragmas == {
+        "journal_mode": "WAL", "synchronous": "FULL"
+    }
 
 
 # ============================================================================
@@ -374,14 +786,15 @@ class TestHealthCheck:
 # ============================================================================
 #
 # 1. TEST STRUCTURE:
-#    - Classes group related tests
+#    - Classes group related tests (a single test needs no class)
 #    - test_* functions are discovered by pytest
 #    - Arrange → Act → Assert pattern
 #
 # 2. ASSERTIONS:
 #    - assert condition: Fails if False
 #    - assert a == b: Equality check
-#    - "in" for checking substrings
+#    - Compare whole values (== {"detail": ...}) - catches any change
+#    - expected.items() <= data.items(): data contains all of expected
 #
 # 3. HTTP STATUS CODES:
 #    - 200 OK: Success (GET, PUT)
@@ -393,6 +806,8 @@ class TestHealthCheck:
 # 4. FIXTURES:
 #    - client: Makes HTTP requests
 #    - sample_task: Pre-created task for tests
+#    - @pytest.mark.ro: the test never writes (skips the rollback)
+#    - seeded_tasks(n): n tasks inserted directly (no HTTP)
 #
 # 5. TEST CLIENT:
 #    - client.get("/path")
@@ -401,4 +816,13 @@ class TestHealthCheck:
 #    - client.delete("/path")
 #    - response.status_code, response.json()
 #
+# 6. ASYNC TESTS:
+#    - "async def test_..." runs on an event loop (pytest-asyncio)
+#    - await async_client.get(...); asyncio.gather() for several at once
+#
+# 7. PARAMETRIZE:
+#    - @pytest.mark.parametrize runs one test function per case
+#    - pytest.param(..., id="minimal") names the case in the output
+#    - getattr(client, "get") picks the HTTP method from a string
+#
 # ============================================================================